@@ -5,13 +5,23 @@ Handles loading, saving, and platform-specific paths
 import json
 import os
 import platform
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterator, List
 
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# Host platform, resolved once at import
+IS_WINDOWS = platform.system() == "Windows"
+IS_MACOS = platform.system() == "Darwin"
+
 
 class Config:
     """Manages configuration with interactive updates"""
@@ -31,8 +41,9 @@ class Config:
             "watched_folders": [],
             "quarantine_path": self._get_default_quarantine_path(),
             "check_interval": 5,  # seconds
+            "batch_interval": 0.25,  # seconds of quiet that ends a burst of new files
             "use_hash": False,  # Hash verification OFF by default
-            "hash_algorithm": "sha256",
+            "hash_algorithm": "sha256",  # md5, sha1, sha256, sha512, or blake3/xxh3 (if installed)
             "time_window": 300,  # 5 minutes in seconds
             "check_time": False,  # Time window OFF by default
             "check_size": True,  # Check file size
@@ -43,17 +54,21 @@ class Config:
             "log_backup_count": 5,
             "delete_after_days": 30,
             "dry_run": False,  # Dry run mode
+            "console_output": True,  # Per-file status lines (terminal only; always logged)
             "enabled": True
         }
         self.config = self.load_config()
+        self._listeners: List[Callable[[str, Any], None]] = []
+        self._batch_depth = 0
+        self._unsaved = False
 
     def _get_config_dir(self) -> str:
         """Get platform-specific configuration directory"""
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Windows: %APPDATA%\DuplicateMonitor
             base = os.environ.get('APPDATA', os.path.expanduser('~'))
             return os.path.join(base, 'DuplicateMonitor')
-        elif platform.system() == "Darwin":
+        elif IS_MACOS:
             # macOS: ~/Library/Application Support/DuplicateMonitor
             return os.path.expanduser('~/Library/Application Support/DuplicateMonitor')
         else:
@@ -66,12 +81,12 @@ class Config:
         home = Path.home()
 
         # Try to detect and avoid cloud folders
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Windows: Use Documents\Quarantined_Duplicates if not in OneDrive
             docs = home / "Documents"
             if "OneDrive" not in str(docs):
                 return str(docs / "Quarantined_Duplicates")
-        elif platform.system() == "Darwin":
+        elif IS_MACOS:
             # macOS: Use ~/Quarantined_Duplicates (outside of iCloud Documents)
             return str(home / "Quarantined_Duplicates")
 
@@ -81,8 +96,9 @@ class Config:
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default"""
         if os.path.exists(self.config_file):
-            with open(self.config_file, 'r') as f:
-                loaded = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+                loaded = orjson.loads(data) if orjson is not None else json.loads(data)
                 # Merge with defaults to add any new keys
                 for key, value in self.default_config.items():
                     if key not in loaded:
@@ -92,8 +108,14 @@ class Config:
 
     def save_config(self) -> None:
         """Save current configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        if orjson is not None:
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+        else:
+            # dumps() + one write; dump() streams many small writes
+            data = json.dumps(self.config, indent=2)
+            with open(self.config_file, 'w') as f:
+                f.write(data)
         console.print(f"[green]Configuration saved to {self.config_file}[/green]")
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -103,4 +125,38 @@ class Config:
     def set(self, key: str, value: Any) -> None:
         """Set configuration value"""
         self.config[key] = value
-        self.save_config()
+        if self._batch_depth:
+            self._unsaved = True
+        else:
+            self.save_config()
+        for callback in self._listeners:
+            callback(key, value)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the block exits, so several set() calls write once"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._unsaved:
+                self._unsaved = False
+                self.save_config()
+
+    def subscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """Register a callback run with (key, value) after each set()"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """Remove a callback registered with subscribe(), if present"""
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies of the config do not inherit change listeners
+        state = self.__dict__.copy()
+        state['_listeners'] = []
+        return state
@@ -3,37 +3,142 @@ File system event handler for duplicate detection
 Monitors file creation and checks for duplicates
 """
 import os
-import re
-import hashlib
-import shutil
 import stat
-import platform
 import logging
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Set, Tuple, Optional
-from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Set, Tuple, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from watchdog.events import FileSystemEventHandler
 from rich.console import Console
 
-from .config import Config
-from .utils import get_relative_path, is_potential_duplicate, format_time_window
+from .config import IS_WINDOWS, Config
+from .hash_cache import HashCache
+from .quarantine_catalog import QuarantineCatalog
+from .utils import (DUPLICATE_SUFFIX_RE, compile_duplicate_patterns, format_time_window,
+                    get_relative_path, is_potential_duplicate, move_file, new_hasher,
+                    reserve_unique_path)
 
 console = Console()
 
+# Bytes compared at each end (and the middle) of a file before a full hash
+PREFILTER_HEAD_BYTES = 64 * 1024
+PREFILTER_TAIL_BYTES = 64 * 1024
+PREFILTER_MIDDLE_BYTES = 64 * 1024
+
+# Files up to this size are compared in full by the head and tail windows
+PREFILTER_FULL_COMPARE_BYTES = PREFILTER_HEAD_BYTES + PREFILTER_TAIL_BYTES
+
+# Bytes read from each file per step of a full content comparison
+COMPARE_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Quarantined filenames remembered per session (oldest are forgotten first)
+PROCESSED_FILES_LIMIT = 10000
+
+# Number of recently scanned directories kept in the listing cache
+DIR_CACHE_SIZE = 64
+
+# A listing is only reused if taken this long after the folder's mtime, since
+# FAT, HFS+ and SMB timestamps are too coarse to show changes made just after it
+DIR_CACHE_MTIME_SLACK_NS = 2 * 1000 * 1000 * 1000
+
+# Default quiet period (seconds) that ends a burst of file events
+EVENT_BATCH_WINDOW = 0.25
+
+# Longest a burst is held back (seconds) while files in it keep being written
+EVENT_BATCH_MAX_WAIT = 2.0
+
+# Seconds between hash-cache commits while the worker is idle, so no write
+# transaction outlives a burst whichever front end is running
+HASH_CACHE_FLUSH_INTERVAL = 1.0
+
+# Write buffer for the log file; it is flushed whenever the log queue drains
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+# Creation time from a stat result, picked per platform at import
+if IS_WINDOWS:
+    def _creation_time(stat_info: os.stat_result) -> float:
+        """Get creation time from a stat result (st_ctime is creation on Windows)"""
+        return stat_info.st_ctime
+else:
+    def _creation_time(stat_info: os.stat_result) -> float:
+        """Get creation time from a stat result (earliest of ctime and mtime)"""
+        return min(stat_info.st_ctime, stat_info.st_mtime)
+
+
+class _BurstFlushFileHandler(RotatingFileHandler):
+    """Rotating log file that flushes once per burst of records
+
+    Records are written through a larger buffer and flushed only when no
+    more are waiting in log_queue, so a burst costs one write instead of one
+    per line while an idle log is always up to date on disk.
+    """
+    def __init__(self, *args, log_queue: "queue.SimpleQueue", **kwargs):
+        self._log_queue = log_queue
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+
+    def flush(self):
+        if self._log_queue.empty():
+            super().flush()
+
 
 class DuplicateHandler(FileSystemEventHandler):
     """Handles file system events and checks for duplicates"""
     def __init__(self, config: Config):
         self.config = config
         self.processed_files: Set[str] = set()
-        self.file_hashes: Dict[str, str] = {}
+        self._processed_order: "deque[str]" = deque()
+        self._hash_cache = HashCache(os.path.join(config.config_dir, "hashes.sqlite"))
+        self._quarantine_catalog = QuarantineCatalog(os.path.join(config.config_dir, "quarantine.sqlite"))
+        self._dir_cache: "OrderedDict[str, Tuple[int, List[str]]]" = OrderedDict()
+        self._dir_cache_lock = threading.Lock()
+        self._pending: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._queued: Set[str] = set()
+        self._worker: Optional[threading.Thread] = None
+        # Native and polling observers call in from their own threads
+        self._queue_lock = threading.Lock()
         self.check_count = 0
         self.duplicate_count = 0
         self.session_start = datetime.now()
+        self._load_settings()
+        self.config.subscribe(self._on_config_changed)
         self.setup_logging()
 
+    def _load_settings(self):
+        """Snapshot config values read on every file event"""
+        self._check_size = bool(self.config.get("check_size"))
+        self._check_time = bool(self.config.get("check_time"))
+        self._time_window = self.config.get("time_window") or 0
+        self._use_hash = bool(self.config.get("use_hash"))
+        self._compare_bytes = bool(self.config.get("compare_bytes", False))
+        self._hash_algo = self.config.get("hash_algorithm")
+        self._dry_run = bool(self.config.get("dry_run", False))
+        self._quarantine_base = self.config.get("quarantine_path")
+        self._watched_folders = list(self.config.get("watched_folders", []))
+        self._duplicate_re = compile_duplicate_patterns(self.config.get("file_patterns", []))
+        self._batch_interval = float(self.config.get("batch_interval", EVENT_BATCH_WINDOW))
+        self._console_output = sys.stdout.isatty() and bool(self.config.get("console_output", True))
+
+    def _notify(self, message: str):
+        """Print a per-file status line when attached to an interactive terminal"""
+        if self._console_output:
+            console.print(message)
+
+    def _on_config_changed(self, key: str, value):
+        """Refresh the settings snapshot when the config is updated"""
+        self._load_settings()
+
     def setup_logging(self):
         """Setup intelligent logging with rotation"""
         log_file = self.config.get("log_file")
@@ -54,20 +159,30 @@ class DuplicateHandler(FileSystemEventHandler):
             datefmt='%Y-%m-%d %H:%M:%S'
         )
 
+        # Writes happen on a listener thread; logging calls only enqueue
+        log_queue = queue.SimpleQueue()
+
         # File handler with rotation
-        file_handler = RotatingFileHandler(
+        file_handler = _BurstFlushFileHandler(
             log_file, 
             maxBytes=max_bytes,
-            backupCount=backup_count
+            backupCount=backup_count,
+            log_queue=log_queue
         )
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        output_handlers = [file_handler]
 
         # Also log to console if in DEBUG mode
         if log_level == logging.DEBUG:
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            output_handlers.append(console_handler)
+
+        self._log_queue_handler = QueueHandler(log_queue)
+        self._log_listener = QueueListener(log_queue, *output_handlers,
+                                           respect_handler_level=True)
+        self._log_listener.start()
+        self.logger.addHandler(self._log_queue_handler)
 
         self.logger.info("="*60)
         self.logger.info(f"Duplicate File Preventer started - Session: {self.session_start}")
@@ -99,89 +214,244 @@ class DuplicateHandler(FileSystemEventHandler):
         if event.is_directory:
             return
 
-        file_path = event.src_path
+        self._queue_file(event.src_path)
+
+    def on_moved(self, event):
+        """Handle files renamed into place (e.g. written to a temp name first)"""
+        if event.is_directory:
+            return
+
+        self._queue_file(event.dest_path)
+
+    def on_modified(self, event):
+        """Hold back a queued file while it is still being written"""
+        if event.is_directory:
+            return
 
-        # Check if file matches duplicate pattern
-        if is_potential_duplicate(file_path, self.config.get("file_patterns", [])):
-            self.check_count += 1
-            console.print(f"[yellow]Checking potential duplicate: {os.path.basename(file_path)}[/yellow]")
-            self.logger.info(f"Potential duplicate detected: {file_path}")
-            self._handle_duplicate(file_path)
+        # Re-queueing extends the current burst's quiet period
+        with self._queue_lock:
+            if event.src_path in self._queued:
+                self._pending.put(event.src_path)
+
+    def _queue_file(self, file_path: str):
+        """Queue a new file for checking if it matches the duplicate pattern"""
+        # Bursts of new files are processed together off the observer thread
+        if is_potential_duplicate(file_path, self._duplicate_re):
+            with self._queue_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._process_events,
+                                                    name="duplicate-worker", daemon=True)
+                    self._worker.start()
+                self._queued.add(file_path)
+                self._pending.put(file_path)
+
+    def _process_events(self):
+        """Worker loop: collect a burst of events, then check them by directory"""
+        while True:
+            try:
+                file_path = self._pending.get(timeout=HASH_CACHE_FLUSH_INTERVAL)
+            except queue.Empty:
+                self._hash_cache.flush()
+                continue
+            if file_path is None:
+                return
+
+            batch = [file_path]
+            stop = False
+            deadline = time.monotonic() + EVENT_BATCH_MAX_WAIT
+            while True:
+                # Wait for a quiet period, but don't let a steady writer stall the batch
+                timeout = min(self._batch_interval, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+                try:
+                    file_path = self._pending.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if file_path is None:
+                    stop = True
+                    break
+                batch.append(file_path)
+
+            # Coalesce repeated events and keep each directory's files together
+            batch = sorted(dict.fromkeys(batch), key=os.path.dirname)
+            with self._queue_lock:
+                self._queued.difference_update(batch)
+            for file_path in batch:
+                self.check_count += 1
+                self._notify(f"[yellow]Checking potential duplicate: {os.path.basename(file_path)}[/yellow]")
+                self.logger.info(f"Potential duplicate detected: {file_path}")
+                try:
+                    self._handle_duplicate(file_path)
+                except FileNotFoundError:
+                    self.logger.info(f"SKIPPED: {file_path} no longer exists")
+                except Exception as e:
+                    self.logger.error(f"FAILED - Error checking {file_path}: {str(e)}")
+
+            if stop:
+                return
+
+    def close(self):
+        """Finish queued checks, stop the worker thread and save the hash cache"""
+        # A closed handler must not keep reacting to settings changes
+        self.config.unsubscribe(self._on_config_changed)
+        with self._queue_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._pending.put(None)
+            worker.join()
+        self._hash_cache.close()
+        self._quarantine_catalog.close()
+        self._stop_log_listener()
+
+    def _stop_log_listener(self):
+        """Flush queued log records and switch the logger back to direct writes"""
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+
+        # Keep later messages (restores, cleanups) going to the same files,
+        # unless another handler has since taken over the shared logger
+        if self._log_queue_handler in self.logger.handlers:
+            self.logger.removeHandler(self._log_queue_handler)
+            for handler in self._log_listener.handlers:
+                self.logger.addHandler(handler)
+        self._log_listener = None
+
+    def reopen_log_files(self):
+        """Make file log handlers reopen their path on the next write
+
+        Used after the log file has been renamed aside, so new records go to
+        the fresh file instead of following the old one.
+        """
+        handlers = list(self.logger.handlers)
+        if self._log_listener is not None:
+            handlers.extend(self._log_listener.handlers)
+        for handler in handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.acquire()
+                try:
+                    if handler.stream is not None:
+                        handler.stream.close()
+                        handler.stream = None
+                finally:
+                    handler.release()
 
     def _handle_duplicate(self, file_path: str):
         """Process potential duplicate file with detailed logging"""
+        original = self._find_original(file_path)
+        if original:
+            self.quarantine_duplicate(file_path, original)
+
+    def quarantine_duplicate(self, file_path: str, original_path: str):
+        """Quarantine a file already confirmed as a duplicate of original_path"""
+        self._quarantine_file(file_path, f"Duplicate of {os.path.basename(original_path)}")
+        self.duplicate_count += 1
+
+    def _find_original(self, file_path: str, exclude: Optional[Set[str]] = None) -> Optional[str]:
+        """Find the file that file_path duplicates, without moving anything
+
+        Safe to call from several threads at once; quarantining is left to
+        the caller so moves stay serialized. Paths in exclude (such as files
+        already quarantined by the caller) are never chosen as the original.
+        """
         filename = os.path.basename(file_path)
-        file_size = os.path.getsize(file_path)
-
-        # Get creation time (platform-specific)
-        if platform.system() == 'Windows':
-            file_ctime = os.path.getctime(file_path)
-        else:
-            stat_info = os.stat(file_path)
-            file_ctime = min(stat_info.st_ctime, stat_info.st_mtime)
+        file_stat = os.stat(file_path)
+        file_size = file_stat.st_size
+        file_ctime = _creation_time(file_stat)
 
         self.logger.info(f"Analyzing: {filename} (Size: {file_size} bytes, "
                         f"Created: {datetime.fromtimestamp(file_ctime).strftime('%Y-%m-%d %H:%M:%S')})")
 
         # Find potential original files
-        base_name = re.sub(r'-\d+(\.[^.]+)$', r'\1', filename)
+        base_name = DUPLICATE_SUFFIX_RE.sub(r'\1', filename)
         dir_path = os.path.dirname(file_path)
 
         # Log search process
-        self.logger.debug(f"Looking for original files with base name: {base_name}")
+        self.logger.debug("Looking for original files with base name: %s", base_name)
 
-        # Build list of candidates
+        # Build list of candidates, original first, then other numbered versions
         candidates = []
-        original_path = os.path.join(dir_path, base_name)
-        if os.path.exists(original_path):
-            candidates.append(original_path)
-
-        # Look for other numbered versions
-        for f in os.listdir(dir_path):
-            if f != filename and f.startswith(base_name.rsplit('.', 1)[0]):
-                full_path = os.path.join(dir_path, f)
-                if os.path.isfile(full_path):
-                    candidates.append(full_path)
-
-        self.logger.debug(f"Found {len(candidates)} candidate files to compare")
-
-        # Check each candidate
-        duplicate_found = False
-        for candidate in candidates:
-            self.logger.debug(f"Comparing with: {os.path.basename(candidate)}")
-
-            is_dup, reason = self._check_duplicate_with_reason(file_path, candidate, file_size, file_ctime)
+        stem = base_name.rsplit('.', 1)[0]
+        for name in self._scan_directory(dir_path):
+            if not name.startswith(stem) or name == filename:
+                continue
+            path = os.path.join(dir_path, name)
+            if exclude and path in exclude:
+                continue
+            # Stat fresh: a cached listing's names are current, their files may not be.
+            # Like os.path.isfile, a symlink to a regular file counts as one
+            try:
+                candidate_stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(candidate_stat.st_mode):
+                if name == base_name:
+                    candidates.insert(0, (path, candidate_stat))
+                else:
+                    candidates.append((path, candidate_stat))
+
+        self.logger.debug("Found %d candidate files to compare", len(candidates))
+
+        # Check each candidate; digests are shared so the new file is hashed once
+        digests: Dict[str, str] = {}
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        for candidate, candidate_stat in candidates:
+            if debug_enabled:
+                self.logger.debug("Comparing with: %s", os.path.basename(candidate))
+
+            is_dup, reason = self._check_duplicate_with_reason(file_path, candidate, file_size,
+                                                               file_ctime, candidate_stat, digests)
 
             if is_dup:
                 self.logger.info(f"DUPLICATE CONFIRMED: {filename} is duplicate of "
                                 f"{os.path.basename(candidate)} ({reason})")
-                self._quarantine_file(file_path, f"Duplicate of {os.path.basename(candidate)}")
-                duplicate_found = True
-                self.duplicate_count += 1
-                break
+                return candidate
             else:
-                self.logger.debug(f"Not a duplicate of {os.path.basename(candidate)}: {reason}")
-
-        if not duplicate_found:
-            self.logger.info(f"NO DUPLICATE FOUND: {filename} appears to be unique")
+                if debug_enabled:
+                    self.logger.debug("Not a duplicate of %s: %s", os.path.basename(candidate), reason)
+
+        self.logger.info(f"NO DUPLICATE FOUND: {filename} appears to be unique")
+        return None
+
+    def _scan_directory(self, dir_path: str) -> List[str]:
+        """List a directory's names, reusing the last scan while its mtime is unchanged
+
+        Only names are cached; callers stat the entries they use. A listing
+        taken within DIR_CACHE_MTIME_SLACK_NS of the mtime is not cached, as a
+        later change could land in the same coarse timestamp.
+        """
+        dir_mtime = os.stat(dir_path).st_mtime_ns
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(dir_path)
+            if cached and cached[0] == dir_mtime:
+                self._dir_cache.move_to_end(dir_path)
+                return cached[1]
+
+        listed_at = time.time_ns()
+        names = os.listdir(dir_path)
+        if listed_at - dir_mtime >= DIR_CACHE_MTIME_SLACK_NS:
+            with self._dir_cache_lock:
+                self._dir_cache[dir_path] = (dir_mtime, names)
+                if len(self._dir_cache) > DIR_CACHE_SIZE:
+                    self._dir_cache.popitem(last=False)
+        return names
 
     def _check_duplicate_with_reason(self, file_path: str, original_path: str, 
-                                    file_size: int, file_ctime: float) -> Tuple[bool, str]:
+                                    file_size: int, file_ctime: float,
+                                    original_stat: Optional[os.stat_result] = None,
+                                    digests: Optional[Dict[str, str]] = None) -> Tuple[bool, str]:
         """Check if file is duplicate and return reason"""
         reasons = []
         checks_passed = []
 
-        original_size = os.path.getsize(original_path)
-
-        # Get original creation time
-        if platform.system() == 'Windows':
-            original_ctime = os.path.getctime(original_path)
-        else:
-            stat_info = os.stat(original_path)
-            original_ctime = min(stat_info.st_ctime, stat_info.st_mtime)
+        # Only stat the original when a stat-based check is enabled
+        if original_stat is None and (self._check_size or self._check_time):
+            original_stat = os.stat(original_path)
 
         # Size check
-        if self.config.get("check_size"):
+        if self._check_size:
+            original_size = original_stat.st_size
             if file_size == original_size:
                 checks_passed.append(f"size matches ({file_size} bytes)")
             else:
@@ -189,9 +459,9 @@ class DuplicateHandler(FileSystemEventHandler):
                 return False, "; ".join(reasons)
 
         # Time window check
-        if self.config.get("check_time"):
-            time_diff = abs(file_ctime - original_ctime)
-            time_window = self.config.get("time_window")
+        if self._check_time:
+            time_diff = abs(file_ctime - _creation_time(original_stat))
+            time_window = self._time_window
             if time_diff <= time_window:
                 checks_passed.append(f"time within {time_diff:.1f}s")
             else:
@@ -200,42 +470,158 @@ class DuplicateHandler(FileSystemEventHandler):
                 return False, "; ".join(reasons)
 
         # Hash check
-        if self.config.get("use_hash"):
-            if self._files_are_identical(original_path, file_path):
-                checks_passed.append(f"{self.config.get('hash_algorithm')} hash matches")
+        if self._use_hash:
+            identical, how = self._files_are_identical(original_path, file_path, digests)
+            if identical:
+                checks_passed.append(how)
             else:
-                reasons.append(f"{self.config.get('hash_algorithm')} hash mismatch")
+                reasons.append(how)
+                return False, "; ".join(reasons)
+
+        # Direct content check, for one-off comparisons where a digest would
+        # never be reused
+        elif self._compare_bytes:
+            if self._contents_match(original_path, file_path):
+                checks_passed.append("contents match")
+            else:
+                reasons.append("contents differ")
                 return False, "; ".join(reasons)
 
         # All checks passed
         return True, "; ".join(checks_passed)
 
-    def _files_are_identical(self, file1: str, file2: str) -> bool:
-        """Compare files using hash"""
-        hash_algo = self.config.get("hash_algorithm")
-
-        def get_file_hash(filepath):
-            hasher = hashlib.new(hash_algo)
-            with open(filepath, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-
-        return get_file_hash(file1) == get_file_hash(file2)
+    def _files_are_identical(self, file1: str, file2: str,
+                             digests: Optional[Dict[str, str]] = None) -> Tuple[bool, str]:
+        """Compare file contents, rejecting obvious mismatches early
+
+        Digests already in the hash cache are reused; when neither file has
+        one, the files are compared directly and hashed on the way, so a
+        mismatch stops at the first differing chunk. digests, if given,
+        memoizes hashes across calls for the same event. Returns whether the
+        files match and a reason naming the comparison that decided it.
+        """
+        hash_algo = self._hash_algo
+
+        # One stat per file serves the size check and the cache keys
+        stat1 = os.stat(file1)
+        stat2 = os.stat(file2)
+
+        # Different sizes can never hash the same
+        size1 = stat1.st_size
+        if size1 != stat2.st_size:
+            return False, "contents differ (size)"
+
+        # Compare sampled windows before reading everything
+        if size1 > 0 and not self._samples_match(file1, file2, size1):
+            return False, "contents differ"
+
+        # Small files were just compared in full with a single memcmp per window,
+        # which proves more than a digest would
+        if size1 <= PREFILTER_FULL_COMPARE_BYTES:
+            return True, "contents match"
+
+        if digests is None:
+            digests = {}
+        stats = {file1: stat1, file2: stat2}
+        for path in (file1, file2):
+            if path not in digests:
+                cached = self._hash_cache.lookup(path, hash_algo, stats[path])
+                if cached is not None:
+                    digests[path] = cached
+
+        missing = [path for path in (file1, file2) if path not in digests]
+        if len(missing) == 1:
+            # One side is known, so hashing the other reads a single file
+            path = missing[0]
+            digests[path] = self._hash_cache.get_hash(path, hash_algo, stats[path])
+        elif missing:
+            # Neither is known: compare directly, stopping at the first difference.
+            # Identical files share one digest, so only one side is hashed.
+            hasher = new_hasher(hash_algo)
+            if not self._streams_match(file1, file2, hasher):
+                return False, "contents differ"
+            digest = hasher.hexdigest()
+            self._hash_cache.store(file1, stat1, hash_algo, digest)
+            self._hash_cache.store(file2, stat2, hash_algo, digest)
+            digests[file1] = digests[file2] = digest
+            return True, "contents match"
+        if digests[file1] == digests[file2]:
+            return True, f"{hash_algo} hash matches"
+        return False, f"{hash_algo} hash mismatch"
+
+    @classmethod
+    def _contents_match(cls, file1: str, file2: str) -> bool:
+        """Compare two files byte for byte, stopping at the first difference"""
+        size = os.path.getsize(file1)
+        if size != os.path.getsize(file2):
+            return False
+        if size == 0:
+            return True
+        if not cls._samples_match(file1, file2, size):
+            return False
+        if size <= PREFILTER_FULL_COMPARE_BYTES:
+            return True
+        return cls._streams_match(file1, file2)
+
+    @staticmethod
+    def _streams_match(file1: str, file2: str, hasher: Any = None) -> bool:
+        """Read two files in lockstep, stopping at the first differing chunk
+
+        A hasher, if given, is fed the contents as they are compared.
+        """
+        buf1 = bytearray(COMPARE_CHUNK_SIZE)
+        buf2 = bytearray(COMPARE_CHUNK_SIZE)
+        view1 = memoryview(buf1)
+        view2 = memoryview(buf2)
+        with open(file1, 'rb', buffering=0) as f1, open(file2, 'rb', buffering=0) as f2:
+            while True:
+                n1 = f1.readinto(buf1)
+                n2 = f2.readinto(buf2)
+                if n1 != n2 or view1[:n1] != view2[:n2]:
+                    return False
+                if not n1:
+                    return True
+                if hasher is not None:
+                    hasher.update(view1[:n1])
+
+    @staticmethod
+    def _samples_match(file1: str, file2: str, size: int) -> bool:
+        """Check that the first, middle and last bytes of two same-size files match
+
+        Reads at most three windows per file, so differing large files are
+        usually rejected without hashing them in full.
+        """
+        # Windows are read rather than mapped: a file shrinking in a watched
+        # folder only shortens a read, where it would fault a mapping
+        windows = [(0, PREFILTER_HEAD_BYTES)]
+        if size > PREFILTER_HEAD_BYTES:
+            tail_start = max(PREFILTER_HEAD_BYTES, size - PREFILTER_TAIL_BYTES)
+            windows.append((tail_start, size - tail_start))
+        # Only large files have an unchecked middle worth sampling
+        if size > PREFILTER_HEAD_BYTES + PREFILTER_MIDDLE_BYTES + PREFILTER_TAIL_BYTES:
+            windows.append(((size - PREFILTER_MIDDLE_BYTES) // 2, PREFILTER_MIDDLE_BYTES))
+
+        with open(file1, 'rb', buffering=0) as f1, open(file2, 'rb', buffering=0) as f2:
+            for offset, length in windows:
+                f1.seek(offset)
+                f2.seek(offset)
+                if f1.read(length) != f2.read(length):
+                    return False
+        return True
 
     def _quarantine_file(self, file_path: str, reason: str):
         """Move file to quarantine folder with path preservation"""
-        if self.config.get("dry_run", False):
+        if self._dry_run:
             # Dry run mode - just log what would happen
-            console.print(f"[cyan]DRY RUN: Would quarantine {os.path.basename(file_path)}[/cyan]")
+            self._notify(f"[cyan]DRY RUN: Would quarantine {os.path.basename(file_path)}[/cyan]")
             self.logger.info(f"DRY RUN - WOULD QUARANTINE: {file_path} (Reason: {reason})")
             return
 
-        quarantine_base = self.config.get("quarantine_path")
+        quarantine_base = self._quarantine_base
         date_folder = datetime.now().strftime("%Y-%m-%d")
 
         # Find the relative path from a known cloud/base folder
-        relative_path = get_relative_path(file_path, self.config.get("watched_folders", []))
+        relative_path = get_relative_path(file_path, self._watched_folders)
 
         # Create quarantine path preserving directory structure
         if relative_path:
@@ -247,43 +633,47 @@ class DuplicateHandler(FileSystemEventHandler):
         os.makedirs(quarantine_path, exist_ok=True)
 
         filename = os.path.basename(file_path)
-        dest_path = os.path.join(quarantine_path, filename)
-
-        # Handle existing files in quarantine
-        counter = 1
-        while os.path.exists(dest_path):
-            name, ext = os.path.splitext(filename)
-            dest_path = os.path.join(quarantine_path, f"{name}_{counter}{ext}")
-            counter += 1
+        dest_path = None
 
         try:
             # Get file size before moving
             file_size = os.path.getsize(file_path)
 
-            # Move the file
-            shutil.move(file_path, dest_path)
+            # Claim a free name in quarantine, then move the file onto it
+            dest_path = reserve_unique_path(quarantine_path, filename)
+            try:
+                move_file(file_path, dest_path)
+            except Exception:
+                os.remove(dest_path)
+                raise
 
             # Log success
-            console.print(f"[green]✓ Moved duplicate: {filename} → quarantine[/green]")
+            self._notify(f"[green]✓ Moved duplicate: {filename} → quarantine[/green]")
             self.logger.info(f"QUARANTINED: {file_path} -> {dest_path} "
                             f"(Size: {file_size} bytes, Reason: {reason})")
 
             # Create restoration info file
             info_path = dest_path + ".restore_info"
+            quarantined_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             with open(info_path, 'w') as f:
-                f.write(f"Original path: {file_path}\n")
-                f.write(f"Quarantined: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Reason: {reason}\n")
-                f.write(f"Size: {file_size} bytes\n")
-
-            # Track statistics
-            self.processed_files.add(filename)
+                f.write(f"Original path: {file_path}\n"
+                        f"Quarantined: {quarantined_at}\n"
+                        f"Reason: {reason}\n"
+                        f"Size: {file_size} bytes\n")
+            self._quarantine_catalog.add(quarantine_base, dest_path)
+
+            # Track statistics, keeping only the most recent names
+            if filename not in self.processed_files:
+                self.processed_files.add(filename)
+                self._processed_order.append(filename)
+                if len(self._processed_order) > PROCESSED_FILES_LIMIT:
+                    self.processed_files.discard(self._processed_order.popleft())
 
         except PermissionError:
-            console.print(f"[red]Permission denied: {filename}[/red]")
+            self._notify(f"[red]Permission denied: {filename}[/red]")
             self.logger.error(f"FAILED - Permission denied: {file_path}")
         except Exception as e:
-            console.print(f"[red]Error moving file: {e}[/red]")
+            self._notify(f"[red]Error moving file: {e}[/red]")
             self.logger.error(f"FAILED - Error moving {file_path}: {str(e)}")
 
     def get_statistics(self) -> dict:
@@ -5,64 +5,288 @@ Provides interactive menu and monitoring control
 import os
 import re
 import shutil
+import sqlite3
+import sys
 import time
+import threading
 import argparse
-import copy
 import atexit
-import subprocess
+from collections import ChainMap, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-from watchdog.observers import Observer
 from rich.console import Console
+from rich.markup import escape
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.table import Table
+from rich.text import Text
 
 from .config import Config
 from .duplicate_handler import DuplicateHandler
-from .utils import clean_path, format_size, is_cloud_folder, parse_time_window, format_time_window
+from .quarantine_catalog import QuarantineCatalog
+from .utils import (DUPLICATE_SUFFIX_RE, clean_path, format_size, is_cloud_folder,
+                    parse_time_window, format_time_window, copy_file, get_hash_algorithms,
+                    grep_lines, is_network_path, iter_line_blocks, line_start,
+                    minimal_watch_roots, move_file, scan_files, tail_lines)
 from ._version import __version__
 
+# OS-level lock on monitor.lock; released automatically if the process dies
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
 console = Console()
 
+# Log line keywords and their display colors, highest priority first
+_LOG_LINE_STYLES = (
+    ("ERROR", "red"),
+    ("FAILED", "red"),
+    ("WARNING", "yellow"),
+    ("DUPLICATE CONFIRMED", "green"),
+    ("QUARANTINED", "green"),
+    ("NO DUPLICATE", "blue"),
+    ("DRY RUN", "cyan"),
+)
+_LOG_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword, _ in _LOG_LINE_STYLES))
+_LOG_KEYWORD_RANK = {keyword: (rank, style) for rank, (keyword, style) in enumerate(_LOG_LINE_STYLES)}
+
+# ANSI color codes for the log styles, used when awk colors --show-log output
+_ANSI_COLORS = {"red": 31, "yellow": 33, "green": 32, "blue": 34, "cyan": 36}
+
+# Upper bound on threads used to check watched folders before scheduling
+MAX_EXISTS_WORKERS = 16
+
+# Largest and default worker thread counts for hashing during a cleanup scan
+MAX_SCAN_WORKERS = 16
+DEFAULT_SCAN_WORKERS = 8
+
+# Threads deleting expired files when cleaning old quarantine
+CLEANUP_DELETE_WORKERS = 8
+
+# Matching files between progress updates during a cleanup scan
+SCAN_PROGRESS_EVERY = 100
+
+# Sync-client metadata and trash folders never scanned for duplicates
+SCAN_SKIP_DIR_NAMES = frozenset({".dropbox.cache", ".Trash", ".Trashes", "$RECYCLE.BIN"})
+
+# Seconds a watched-folder existence check stays valid for menu rendering
+EXISTS_CACHE_TTL = 2.0
+
+# Year folder in a path (e.g. /2024/ or \2024\) for suggesting the next year
+_YEAR_PATH_RE = re.compile(r'[\\/]20\d{2}[\\/]')
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Matched log lines written to the console per print call in log search and the error view
+SEARCH_OUTPUT_BATCH = 64
+
+# Native search tools for log search, fastest first (case-insensitive, fixed string)
+_SEARCH_TOOLS = (
+    ("rg", ("--no-line-number", "--ignore-case", "--fixed-strings", "--")),
+    ("grep", ("-i", "-F", "--")),
+)
+
+# Original-path line of a .restore_info file, and how much of the file to read for it
+_RESTORE_ORIGINAL_RE = re.compile(r'^Original path: ([^\r\n]+)', re.MULTILINE)
+RESTORE_INFO_READ_LIMIT = 4096
+
+# Byte-level prefilter for the errors and warnings view
+_ERROR_LINE_RE = re.compile(rb'ERROR|FAILED|WARNING')
+
+
+# Static menu entries, printed line by line on each render
+_MAIN_MENU_HEAD = (
+    "1. 📁  Manage watched folders",
+    "2. ⚙️   Configure settings",
+    "3. 👁️   View current configuration",
+)
+_MAIN_MENU_TAIL = (
+    "5. 🗑️   View quarantine",
+    "6. 📊  View logs & statistics",
+    "7. 🧹  Clean existing duplicates\n",
+    "Q. 🚪  Quit\n",
+)
+_MAIN_MENU_CHOICES = ("1", "2", "3", "4", "5", "6", "7", "Q", "q")
+_FOLDER_MENU = (
+    "\n1. Add folder (drag & drop supported)",
+    "2. Remove folder",
+    "3. Edit folder path\n",
+    "0. Back to main menu\n",
+)
+_QUARANTINE_MENU = (
+    "\n1. View restoration info for a file",
+    "2. Restore a file",
+    "3. Clean old quarantined files\n",
+    "0. Back\n",
+)
+_STATISTICS_MENU = (
+    "1. View recent activity (last 20 entries)",
+    "2. View errors and warnings only",
+    "3. View detailed debug log",
+    "4. Search logs",
+    "5. Export logs",
+    "6. Clear old logs\n",
+    "0. Back to main menu\n",
+)
+
+
+def _log_stamp(text: str) -> Optional[bytes]:
+    """Validate a 'YYYY-MM-DD[ HH:MM[:SS]]' search bound as a log timestamp prefix"""
+    text = text.strip()
+    if not text:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        return text.encode('ascii')
+    raise ValueError(f"Invalid date/time: {text}")
+
+
+def _tool_search_lines(log_file: str, search_term: str) -> Optional[Iterator[str]]:
+    """Search the log with ripgrep or grep if installed, else return None
+
+    The log is opened here and fed to the tool on stdin, so a missing file
+    raises FileNotFoundError before any process is started.
+    """
+    for name, args in _SEARCH_TOOLS:
+        tool = shutil.which(name)
+        if tool:
+            break
+    else:
+        return None
+    return _stream_tool_output(open(log_file, 'rb'), [tool, *args, search_term])
+
+
+def _stream_tool_output(log, command: List[str]) -> Iterator[str]:
+    """Yield decoded output lines of a search command reading the log on stdin"""
+    import subprocess
+    with log, subprocess.Popen(command, stdin=log, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL) as proc:
+        for line in proc.stdout:
+            yield line.decode('utf-8', errors='replace')
+
+
+def _casefold_search_lines(blocks: Iterator[bytes], needle: str, low: Optional[str],
+                           high: Optional[str]) -> Iterator[str]:
+    """Yield lines containing a casefolded needle, within optional timestamp bounds"""
+    for block in blocks:
+        text = block.decode('utf-8', errors='replace')
+        # Most blocks hold no match; fold the whole block once to skip them
+        if needle not in text.casefold():
+            continue
+        for line in text.splitlines():
+            if (needle in line.casefold()
+                    and (low is None or line[:len(low)] >= low)
+                    and (high is None or line[:len(high)] <= high)):
+                yield line
+
+
+def _log_line_style(line: str) -> Optional[str]:
+    """Get the display color for a log line, or None for plain lines"""
+    keywords = _LOG_KEYWORD_RE.findall(line)
+    if not keywords:
+        return None
+    return min(_LOG_KEYWORD_RANK[keyword] for keyword in keywords)[1]
+
+
+def _log_text(lines: List[str], styled: bool = True) -> Text:
+    """Join log lines into one Text, colored by keyword, without markup parsing"""
+    return Text("\n").join(
+        Text(line, style=(_log_line_style(line) or "") if styled else "")
+        for line in (line.strip() for line in lines)
+    )
+
+
+def _awk_color_program() -> str:
+    """Build an awk program that colors log lines the way _log_line_style does"""
+    rules = ["NF == 0 { next }"]
+    for keyword, style in _LOG_LINE_STYLES:
+        rules.append(f'index($0, "{keyword}") {{ printf "\\033[{_ANSI_COLORS[style]}m%s\\033[0m\\n", $0; '
+                     f'fflush(); next }}')
+    rules.append("{ print; fflush() }")
+    return "\n".join(rules)
+
+
+class _OverrideConfig:
+    """View of a Config with some keys overridden, for one-off scans
+
+    Writes to .config land in the overrides only; the base Config and its
+    file are never touched.
+    """
+    def __init__(self, base: Config, overrides: Optional[Dict[str, Any]] = None):
+        self.base = base
+        self.overrides: Dict[str, Any] = dict(overrides or {})
+        self.config = ChainMap(self.overrides, base.config)
+        self.config_dir = base.config_dir
+        self.config_file = base.config_file
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the overridden value, else the base configuration value"""
+        return self.config.get(key, default)
+
+    def subscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """No-op; a scan's settings are fixed once it starts"""
+
+    def unsubscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """No-op; nothing is ever subscribed"""
+
 
 class DuplicateMonitor:
     """Main application class"""
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config()
         self.observer = None
+        self._observers = []
         self.handler = None
         self.monitoring = False
+        self._stop_event = threading.Event()
         self.lock_file = None
-        self._check_lock_file()
+        self._lock_fd = None
+        self._quarantine_catalog: Optional[QuarantineCatalog] = None
+        self._exists_cache: Dict[str, Tuple[float, bool]] = {}
+        self._error_lines_cache: Optional[tuple] = None
+        self._stats_table: Optional[tuple] = None
+        self._menu_screens: Dict[Tuple[bool, bool], str] = {}
+
+    def _menu_screen(self) -> str:
+        """Get the main menu text for the current monitoring and dry-run state"""
+        key = (self.monitoring, bool(self.config.get("dry_run", False)))
+        screen = self._menu_screens.get(key)
+        if screen is None:
+            monitoring, dry_run = key
+            status = "[green]●[/green] Active" if monitoring else "[red]●[/red] Stopped"
+            lines = [
+                f"\n[bold cyan]═══ Duplicate File Preventer v{__version__} ═══[/bold cyan]\n",
+                f"Status: {status}" + (" [cyan](DRY RUN)[/cyan]" if dry_run else ""),
+                "[dim]Auto-save: Enabled[/dim]\n",
+                *_MAIN_MENU_HEAD,
+                "4. ⏸️   Stop monitoring" if monitoring else "4. ▶️   Start monitoring",
+                *_MAIN_MENU_TAIL,
+            ]
+            # Allow Enter/Escape to refresh menu when monitoring
+            if monitoring:
+                lines.append("[dim]Press Enter to refresh menu while monitoring[/dim]\n")
+            screen = self._menu_screens[key] = "\n".join(lines)
+        return screen
+
+    def _pause(self):
+        """Wait for Enter; raises EOFError once input is closed, like the other prompts"""
+        console.input("\nPress Enter to continue...")
 
     def show_menu(self):
         """Display main menu"""
+        cprint = console.print
         while True:
             console.clear()
-            console.print(f"\n[bold cyan]═══ Duplicate File Preventer v{__version__} ═══[/bold cyan]\n")
-
-            # Show current status
-            status = "[green]●[/green] Active" if self.monitoring else "[red]●[/red] Stopped"
-            dry_run = " [cyan](DRY RUN)[/cyan]" if self.config.get("dry_run", False) else ""
-            console.print(f"Status: {status}{dry_run}")
-            console.print("[dim]Auto-save: Enabled[/dim]\n")
-
-            # Menu options
-            console.print("1. 📁  Manage watched folders")
-            console.print("2. ⚙️   Configure settings")
-            console.print("3. 👁️   View current configuration")
-            console.print("4. ▶️   Start monitoring" if not self.monitoring else "4. ⏸️   Stop monitoring")
-            console.print("5. 🗑️   View quarantine")
-            console.print("6. 📊  View logs & statistics")
-            console.print("7. 🧹  Clean existing duplicates\n")
-
-            console.print("Q. 🚪  Quit\n")
-
-            # Allow Enter/Escape to refresh menu when monitoring
-            valid_choices = ["1","2","3","4","5","6","7","Q","q"]
-            if self.monitoring:
-                console.print("[dim]Press Enter to refresh menu while monitoring[/dim]\n")
+            # Status and options are rendered as one cached block
+            cprint(self._menu_screen())
             
             choice = Prompt.ask("Select option", default="")
             
@@ -71,14 +295,14 @@ class DuplicateMonitor:
                 if self.monitoring:
                     continue  # Redisplay menu
                 else:
-                    console.print("[yellow]Please select an option[/yellow]")
-                    input("\nPress Enter to continue...")
+                    cprint("[yellow]Please select an option[/yellow]")
+                    self._pause()
                     continue
             
             # Validate choice
-            if choice not in valid_choices:
-                console.print(f"[red]Invalid option: {choice}[/red]")
-                input("\nPress Enter to continue...")
+            if choice not in _MAIN_MENU_CHOICES:
+                cprint(f"[red]Invalid option: {choice}[/red]")
+                self._pause()
                 continue
                 
             choice = choice.upper()
@@ -100,14 +324,15 @@ class DuplicateMonitor:
             elif choice == "Q":
                 if self.monitoring:
                     self.stop_monitoring()
-                console.print("\n[cyan]Goodbye![/cyan]\n")
+                cprint("\n[cyan]Goodbye![/cyan]\n")
                 break
 
     def manage_folders(self):
         """Manage watched folders with drag-and-drop support"""
+        cprint = console.print
         while True:
             console.clear()
-            console.print("\n[bold]Watched Folders[/bold]\n")
+            cprint("\n[bold]Watched Folders[/bold]\n")
 
             # Display current folders
             folders = self.config.get("watched_folders", [])
@@ -118,18 +343,15 @@ class DuplicateMonitor:
                 table.add_column("Status")
 
                 for i, folder in enumerate(folders, 1):
-                    status = "✓ Valid" if os.path.exists(folder) else "✗ Missing"
+                    status = "✓ Valid" if self._folder_exists(folder) else "✗ Missing"
                     table.add_row(str(i), folder, status)
 
-                console.print(table)
+                cprint(table)
             else:
-                console.print("[yellow]No folders being watched[/yellow]")
-
-            console.print("\n1. Add folder (drag & drop supported)")
-            console.print("2. Remove folder")
-            console.print("3. Edit folder path\n")
+                cprint("[yellow]No folders being watched[/yellow]")
 
-            console.print("0. Back to main menu\n")
+            for option in _FOLDER_MENU:
+                cprint(option)
 
             choice = Prompt.ask("Select option", choices=["1","2","3","0"])
 
@@ -142,6 +364,16 @@ class DuplicateMonitor:
             elif choice == "0":
                 break
 
+    def _folder_exists(self, path: str) -> bool:
+        """os.path.exists for watched-folder status, cached briefly across renders"""
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached and now - cached[0] < EXISTS_CACHE_TTL:
+            return cached[1]
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (now, exists)
+        return exists
+
     def _add_folder(self, folders: list):
         """Add a new folder to watch"""
         console.print("\n[dim]Tip: You can drag and drop a folder here[/dim]")
@@ -157,6 +389,7 @@ class DuplicateMonitor:
             if path not in folders:
                 folders.append(path)
                 self.config.set("watched_folders", folders)
+                self._exists_cache.clear()
                 console.print(f"[green]Added: {path}[/green]")
                 console.print("[dim]Configuration auto-saved[/dim]")
 
@@ -168,7 +401,7 @@ class DuplicateMonitor:
                 console.print("[yellow]Folder already in list[/yellow]")
         else:
             console.print("[red]Invalid folder path[/red]")
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def _remove_folder(self, folders: list):
         """Remove a folder from the watch list"""
@@ -180,10 +413,11 @@ class DuplicateMonitor:
         if 1 <= idx <= len(folders):
             removed = folders.pop(idx - 1)
             self.config.set("watched_folders", folders)
+            self._exists_cache.clear()
             console.print(f"[green]Removed: {removed}[/green]")
         else:
             console.print("[red]Invalid number[/red]")
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def _edit_folder(self, folders: list):
         """Edit an existing folder path"""
@@ -198,8 +432,8 @@ class DuplicateMonitor:
             console.print("[dim]Tip: Use arrow keys to edit, or paste new path[/dim]")
 
             # Suggest common edits
-            if re.search(r'/20\d{2}/', old_path) or re.search(r'\\20\d{2}\\', old_path):
-                year_match = re.search(r'20\d{2}', old_path)
+            if _YEAR_PATH_RE.search(old_path):
+                year_match = _YEAR_RE.search(old_path)
                 if year_match:
                     current_year = year_match.group()
                     new_year = str(int(current_year) + 1)
@@ -213,112 +447,123 @@ class DuplicateMonitor:
                 new_path = os.path.abspath(new_path)
                 folders[idx - 1] = new_path
                 self.config.set("watched_folders", folders)
+                self._exists_cache.clear()
                 console.print(f"[green]Updated path to: {new_path}[/green]")
             else:
                 console.print("[red]Invalid folder path - keeping original[/red]")
         else:
             console.print("[red]Invalid number[/red]")
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def configure_settings(self):
         """Configure application settings"""
+        get = self.config.get
         console.clear()
         console.print("\n[bold]Configuration Settings[/bold]\n")
 
-        # Dry run mode
-        console.print("[bold]Test Mode:[/bold]")
-        dry_run = Confirm.ask("Enable dry run mode? (test without moving files)", 
-                             default=self.config.get("dry_run", False))
-        self.config.set("dry_run", dry_run)
-
-        if dry_run:
-            console.print("[cyan]Dry run enabled - no files will be moved[/cyan]")
-
-        # Detection methods
-        console.print("\n[bold]Detection Methods:[/bold]")
-
-        # Size check
-        check_size = Confirm.ask("Check file size?", 
-                                default=self.config.get("check_size"))
-        self.config.set("check_size", check_size)
-
-        # Time window check
-        check_time = Confirm.ask("Check creation time?", 
-                                default=self.config.get("check_time"))
-        self.config.set("check_time", check_time)
-
-        if check_time:
-            current_window = self.config.get("time_window")
-            current_formatted = format_time_window(current_window)
-            console.print(f"\nCurrent time window: {current_formatted}")
-            console.print("[dim]Format: number + unit (5m, 2h, 3d, 1w, 2mo, 1y)[/dim]")
+        # Save once at the end instead of after every answer
+        with self.config.batch():
+            # Dry run mode
+            console.print("[bold]Test Mode:[/bold]")
+            dry_run = Confirm.ask("Enable dry run mode? (test without moving files)", 
+                                 default=get("dry_run", False))
+            self.config.set("dry_run", dry_run)
+
+            if dry_run:
+                console.print("[cyan]Dry run enabled - no files will be moved[/cyan]")
+
+            # Detection methods
+            console.print("\n[bold]Detection Methods:[/bold]")
+
+            # Size check
+            check_size = Confirm.ask("Check file size?", 
+                                    default=get("check_size"))
+            self.config.set("check_size", check_size)
+
+            # Time window check
+            check_time = Confirm.ask("Check creation time?", 
+                                    default=get("check_time"))
+            self.config.set("check_time", check_time)
+
+            if check_time:
+                current_window = get("time_window")
+                current_formatted = format_time_window(current_window)
+                console.print(f"\nCurrent time window: {current_formatted}")
+                console.print("[dim]Format: number + unit (5m, 2h, 3d, 1w, 2mo, 1y)[/dim]")
             
-            while True:
-                time_str = Prompt.ask("Time window for duplicates", 
-                                     default=current_formatted)
-                seconds = parse_time_window(time_str)
-                if seconds:
-                    self.config.set("time_window", seconds)
-                    console.print(f"[green]Time window set to {format_time_window(seconds)}[/green]")
-                    break
-                else:
-                    console.print("[red]Invalid format. Use: 5m, 2h, 3d, 1w, 2mo, 1y[/red]")
-
-        # Hash verification (optional)
-        use_hash = Confirm.ask("Enable hash verification? (more accurate but slower)", 
-                               default=self.config.get("use_hash"))
-        self.config.set("use_hash", use_hash)
-
-        if use_hash:
-            console.print("\nHash algorithms: md5 (fast), sha256 (secure), sha512 (most secure)")
-            algo = Prompt.ask("Select hash algorithm", 
-                             default=self.config.get("hash_algorithm"),
-                             choices=["md5", "sha1", "sha256", "sha512"])
-            self.config.set("hash_algorithm", algo)
-
-        # Check interval
-        console.print("\n[bold]Monitoring Settings:[/bold]")
-        interval = IntPrompt.ask("File check interval (seconds)", 
-                                default=self.config.get("check_interval"),
-                                show_default=True)
-        self.config.set("check_interval", interval)
-
-        # Quarantine settings
-        console.print("\n[bold]Quarantine Settings:[/bold]")
-        current_quarantine = self.config.get("quarantine_path")
-        console.print(f"Current quarantine path: {current_quarantine}")
-
-        change_quarantine = Confirm.ask("Change quarantine location?", default=False)
-        if change_quarantine:
-            console.print("[dim]Tip: Choose a location outside of Dropbox/OneDrive/iCloud[/dim]")
-            quarantine = Prompt.ask("Quarantine folder path",
-                                   default=current_quarantine)
-            quarantine = clean_path(quarantine)
-
-            # Check if it's inside cloud folders
-            if is_cloud_folder(quarantine):
-                console.print("[yellow]⚠️  Warning: Quarantine folder appears to be in a cloud sync folder![/yellow]")
-                console.print("[yellow]This will sync deleted files back to cloud storage.[/yellow]")
-                if not Confirm.ask("Continue anyway?", default=False):
-                    quarantine = current_quarantine
-
-            self.config.set("quarantine_path", quarantine)
-
-        days = IntPrompt.ask("Delete quarantined files after (days, 0=never)",
-                            default=self.config.get("delete_after_days"))
-        self.config.set("delete_after_days", days)
-
-        # Logging settings
-        console.print("\n[bold]Logging Settings:[/bold]")
-        console.print("Log levels: DEBUG (verbose), INFO (normal), WARNING (important only)")
-        log_level = Prompt.ask("Log level", 
-                              default=self.config.get("log_level", "INFO"),
-                              choices=["DEBUG", "INFO", "WARNING"])
-        self.config.set("log_level", log_level)
-
-        max_size = IntPrompt.ask("Max log file size (MB)",
-                                default=self.config.get("log_max_size", 10))
-        self.config.set("log_max_size", max_size)
+                while True:
+                    time_str = Prompt.ask("Time window for duplicates", 
+                                         default=current_formatted)
+                    seconds = parse_time_window(time_str)
+                    if seconds:
+                        self.config.set("time_window", seconds)
+                        console.print(f"[green]Time window set to {format_time_window(seconds)}[/green]")
+                        break
+                    else:
+                        console.print("[red]Invalid format. Use: 5m, 2h, 3d, 1w, 2mo, 1y[/red]")
+
+            # Hash verification (optional)
+            use_hash = Confirm.ask("Enable hash verification? (more accurate but slower)", 
+                                   default=get("use_hash"))
+            self.config.set("use_hash", use_hash)
+
+            if use_hash:
+                hash_algorithms = get_hash_algorithms()
+                console.print("\nHash algorithms: md5 (fast), sha256 (secure), sha512 (most secure)")
+                if "blake3" in hash_algorithms:
+                    console.print("[dim]blake3 is available and is the fastest on large files[/dim]")
+                if "xxh3" in hash_algorithms:
+                    console.print("[dim]xxh3 is available: a very fast non-cryptographic hash, "
+                                  "fine for spotting duplicates[/dim]")
+                current_algo = get("hash_algorithm")
+                algo = Prompt.ask("Select hash algorithm", 
+                                 default=current_algo if current_algo in hash_algorithms else "sha256",
+                                 choices=hash_algorithms)
+                self.config.set("hash_algorithm", algo)
+
+            # Check interval
+            console.print("\n[bold]Monitoring Settings:[/bold]")
+            interval = IntPrompt.ask("File check interval (seconds)", 
+                                    default=get("check_interval"),
+                                    show_default=True)
+            self.config.set("check_interval", interval)
+
+            # Quarantine settings
+            console.print("\n[bold]Quarantine Settings:[/bold]")
+            current_quarantine = get("quarantine_path")
+            console.print(f"Current quarantine path: {current_quarantine}")
+
+            change_quarantine = Confirm.ask("Change quarantine location?", default=False)
+            if change_quarantine:
+                console.print("[dim]Tip: Choose a location outside of Dropbox/OneDrive/iCloud[/dim]")
+                quarantine = Prompt.ask("Quarantine folder path",
+                                       default=current_quarantine)
+                quarantine = clean_path(quarantine)
+
+                # Check if it's inside cloud folders
+                if is_cloud_folder(quarantine):
+                    console.print("[yellow]⚠️  Warning: Quarantine folder appears to be in a cloud sync folder![/yellow]")
+                    console.print("[yellow]This will sync deleted files back to cloud storage.[/yellow]")
+                    if not Confirm.ask("Continue anyway?", default=False):
+                        quarantine = current_quarantine
+
+                self.config.set("quarantine_path", quarantine)
+
+            days = IntPrompt.ask("Delete quarantined files after (days, 0=never)",
+                                default=get("delete_after_days"))
+            self.config.set("delete_after_days", days)
+
+            # Logging settings
+            console.print("\n[bold]Logging Settings:[/bold]")
+            console.print("Log levels: DEBUG (verbose), INFO (normal), WARNING (important only)")
+            log_level = Prompt.ask("Log level", 
+                                  default=get("log_level", "INFO"),
+                                  choices=["DEBUG", "INFO", "WARNING"])
+            self.config.set("log_level", log_level)
+
+            max_size = IntPrompt.ask("Max log file size (MB)",
+                                    default=get("log_max_size", 10))
+            self.config.set("log_max_size", max_size)
 
         console.print("\n[green]Settings updated and saved![/green]")
 
@@ -328,7 +573,7 @@ class DuplicateMonitor:
         if check_size:
             logic_parts.append("matching file size")
         if check_time:
-            time_window = self.config.get("time_window")
+            time_window = get("time_window")
             logic_parts.append(f"created within {format_time_window(time_window)}")
         logic_parts.append("matching filename pattern (file-1, file-2, etc.)")
         if use_hash:
@@ -336,13 +581,20 @@ class DuplicateMonitor:
 
         console.print("Files are duplicates when: " + " AND ".join(logic_parts))
 
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def view_configuration(self):
         """Display current configuration"""
         console.clear()
         console.print("\n[bold]Current Configuration[/bold]\n")
 
+        get = self.config.get
+        quarantine_path = get("quarantine_path")
+        folders = get("watched_folders", [])
+        check_time = get("check_time")
+        use_hash = get("use_hash")
+        delete_after_days = get("delete_after_days")
+
         # Create a nice table
         table = Table(show_header=False, box=None)
         table.add_column("Setting", style="cyan")
@@ -351,50 +603,49 @@ class DuplicateMonitor:
         # File locations
         table.add_row("[bold]File Locations[/bold]", "")
         table.add_row("  Config File", self.config.config_file)
-        table.add_row("  Log File", self.config.get("log_file"))
-        table.add_row("  Quarantine", self.config.get("quarantine_path"))
+        table.add_row("  Log File", get("log_file"))
+        table.add_row("  Quarantine", quarantine_path)
 
         # Check if quarantine is in cloud
-        if is_cloud_folder(self.config.get("quarantine_path")):
+        if is_cloud_folder(quarantine_path):
             table.add_row("", "[yellow]⚠️  Inside cloud sync folder[/yellow]")
 
         table.add_row("", "")  # Empty row for spacing
 
         # Monitoring
-        table.add_row("Watched Folders", str(len(self.config.get("watched_folders", []))))
+        table.add_row("Watched Folders", str(len(folders)))
 
         # Test mode
-        if self.config.get("dry_run", False):
+        if get("dry_run", False):
             table.add_row("Mode", "[cyan]DRY RUN (test mode)[/cyan]")
 
         # Detection methods
         table.add_row("", "")  # Empty row for spacing
         table.add_row("[bold]Detection Methods[/bold]", "")
-        table.add_row("  File Size Check", "✓ Enabled" if self.config.get("check_size") else "✗ Disabled")
-        table.add_row("  Time Window Check", "✓ Enabled" if self.config.get("check_time") else "✗ Disabled")
-        if self.config.get("check_time"):
-            time_window = self.config.get("time_window")
+        table.add_row("  File Size Check", "✓ Enabled" if get("check_size") else "✗ Disabled")
+        table.add_row("  Time Window Check", "✓ Enabled" if check_time else "✗ Disabled")
+        if check_time:
+            time_window = get("time_window")
             table.add_row("  Time Window", format_time_window(time_window))
-        table.add_row("  Hash Verification", "✓ Enabled" if self.config.get("use_hash") else "✗ Disabled")
-        if self.config.get("use_hash"):
-            table.add_row("  Hash Algorithm", self.config.get("hash_algorithm").upper())
+        table.add_row("  Hash Verification", "✓ Enabled" if use_hash else "✗ Disabled")
+        if use_hash:
+            table.add_row("  Hash Algorithm", get("hash_algorithm").upper())
 
         # Other settings
         table.add_row("", "")  # Empty row for spacing
-        table.add_row("Check Interval", f"{self.config.get('check_interval')} seconds")
-        table.add_row("Auto-delete After", f"{self.config.get('delete_after_days')} days" 
-                      if self.config.get('delete_after_days') > 0 else "Never")
-        table.add_row("Log Level", self.config.get("log_level", "INFO"))
-        table.add_row("Log Max Size", f"{self.config.get('log_max_size', 10)} MB")
+        table.add_row("Check Interval", f"{get('check_interval')} seconds")
+        table.add_row("Auto-delete After", f"{delete_after_days} days" 
+                      if delete_after_days > 0 else "Never")
+        table.add_row("Log Level", get("log_level", "INFO"))
+        table.add_row("Log Max Size", f"{get('log_max_size', 10)} MB")
 
         console.print(table)
 
         # Show watched folders if any
-        folders = self.config.get("watched_folders", [])
         if folders:
             console.print("\n[bold]Watched Folders:[/bold]")
             for i, folder in enumerate(folders, 1):
-                status = "✓" if os.path.exists(folder) else "✗"
+                status = "✓" if self._folder_exists(folder) else "✗"
                 console.print(f"  {i}. {status} {folder}")
 
         # Show auto-save status
@@ -408,7 +659,7 @@ class DuplicateMonitor:
         except:
             pass
 
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def toggle_monitoring(self):
         """Start or stop monitoring"""
@@ -422,14 +673,14 @@ class DuplicateMonitor:
         folders = self.config.get("watched_folders", [])
         if not folders:
             console.print("[red]No folders to watch! Add folders first.[/red]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
 
         # Create monitor lock
         if not self._create_monitor_lock():
             console.print("[red]Another instance is already monitoring![/red]")
             console.print("[yellow]Only one monitoring instance can run at a time.[/yellow]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
 
         console.print("[yellow]Starting monitor...[/yellow]")
@@ -440,16 +691,48 @@ class DuplicateMonitor:
         # Create handler
         self.handler = DuplicateHandler(self.config)
 
+        # Observer backends are only needed once monitoring starts, so --show-log
+        # and menu-only sessions don't pay for loading them
+        from watchdog.observers import Observer
+        from watchdog.observers.polling import PollingObserver
+
+        # One native observer for local folders; network mounts don't deliver
+        # inotify/FSEvents reliably, so they share one polling observer
         self.observer = Observer()
-        for folder in folders:
-            if os.path.exists(folder):
-                self.observer.schedule(self.handler, folder, recursive=True)
-                console.print(f"[green]Watching: {folder}[/green]")
-            else:
+        self._observers = [self.observer]
+        polling_observer = None
+        folders = sorted(set(os.path.abspath(folder) for folder in folders))
+
+        # Check all folders at once so slow network mounts don't stall one after another
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_EXISTS_WORKERS, len(folders)))) as executor:
+            exists = list(executor.map(os.path.exists, folders))
+
+        for folder, folder_exists in zip(folders, exists):
+            if not folder_exists:
                 console.print(f"[red]Skipping missing folder: {folder}[/red]")
 
-        self.observer.start()
+        # Split by filesystem before dropping nested folders: a network mount
+        # inside a local watched folder still needs polling, since native
+        # events never report changes made on the remote side
+        present = [folder for folder, folder_exists in zip(folders, exists) if folder_exists]
+        network = [folder for folder in present if is_network_path(folder)]
+        local = [folder for folder in present if folder not in network]
+
+        for folder in minimal_watch_roots(local):
+            self.observer.schedule(self.handler, folder, recursive=True)
+            console.print(f"[green]Watching: {folder}[/green]")
+
+        for folder in minimal_watch_roots(network):
+            if polling_observer is None:
+                polling_observer = PollingObserver(timeout=self.config.get("check_interval", 5))
+                self._observers.append(polling_observer)
+            polling_observer.schedule(self.handler, folder, recursive=True)
+            console.print(f"[green]Watching (polling, network folder): {folder}[/green]")
+
+        for observer in self._observers:
+            observer.start()
         self.monitoring = True
+        self._stop_event.clear()
         console.print("\n[green]Monitor started successfully![/green]")
         console.print("[dim]Note: Only monitoring NEW files created while running[/dim]")
         console.print("[dim]Press Enter at the menu to refresh display[/dim]\n")
@@ -458,64 +741,75 @@ class DuplicateMonitor:
         """Stop the file system monitor"""
         if self.observer:
             console.print("[yellow]Stopping monitor...[/yellow]")
-            self.observer.stop()
-            self.observer.join()
+            for observer in self._observers:
+                observer.stop()
+            for observer in self._observers:
+                observer.join()
+            self.handler.close()
             self.monitoring = False
+            self._stop_event.set()
             self._release_monitor_lock()
             console.print("[green]Monitor stopped.[/green]")
-            input("\nPress Enter to continue...")
-
-    def _check_lock_file(self):
-        """Check for existing lock file on startup"""
-        lock_path = os.path.join(self.config.config_dir, "monitor.lock")
-        if os.path.exists(lock_path):
-            # Check if lock is stale (older than 1 hour)
-            try:
-                mtime = os.path.getmtime(lock_path)
-                age = time.time() - mtime
-                if age > 3600:  # 1 hour
-                    console.print("[yellow]Found stale lock file, removing...[/yellow]")
-                    os.remove(lock_path)
-            except:
-                pass
+            self._pause()
 
     def _create_monitor_lock(self) -> bool:
-        """Create a lock file for monitoring"""
+        """Take an exclusive OS lock on the monitor lock file
+
+        The lock is held on an open descriptor for as long as monitoring runs,
+        and the OS drops it if the process exits or is killed, so there are
+        no stale lock files to detect.
+        """
         lock_path = os.path.join(self.config.config_dir, "monitor.lock")
-        if os.path.exists(lock_path):
-            # Check if it's current
-            try:
-                with open(lock_path, 'r') as f:
-                    pid = f.read().strip()
-                # Check if process is still running
-                try:
-                    os.kill(int(pid), 0)
-                    return False  # Process exists
-                except (OSError, ValueError):
-                    # Process doesn't exist, remove stale lock
-                    os.remove(lock_path)
-            except:
-                return False
-        
-        # Create lock file
         try:
-            with open(lock_path, 'w') as f:
-                f.write(str(os.getpid()))
-            self.lock_file = lock_path
-            # Register cleanup
-            atexit.register(self._release_monitor_lock)
-            return True
-        except:
+            # Append mode: don't truncate another instance's PID before locking
+            lock_fd = open(lock_path, 'a+')
+        except OSError:
             return False
 
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                lock_fd.seek(0)
+                msvcrt.locking(lock_fd.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_fd.close()
+            return False
+
+        # Record our PID for anyone inspecting the file
+        lock_fd.seek(0)
+        lock_fd.truncate()
+        lock_fd.write(str(os.getpid()))
+        lock_fd.flush()
+
+        self._lock_fd = lock_fd
+        self.lock_file = lock_path
+        # Register cleanup
+        atexit.register(self._release_monitor_lock)
+        return True
+
     def _release_monitor_lock(self):
         """Release the monitor lock"""
-        if self.lock_file and os.path.exists(self.lock_file):
-            try:
-                os.remove(self.lock_file)
-                self.lock_file = None
-            except:
-                pass
+        lock_fd = self._lock_fd
+        if lock_fd is None:
+            return
+        self._lock_fd = None
+        self.lock_file = None
+
+        # The file itself is left in place: deleting it would let a waiting
+        # instance lock the old inode while another creates a new one
+        try:
+            lock_fd.seek(0)
+            lock_fd.truncate()
+            if fcntl is not None:
+                fcntl.flock(lock_fd.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock_fd.seek(0)
+                msvcrt.locking(lock_fd.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+        finally:
+            lock_fd.close()
 
     def clean_existing_duplicates(self):
         """One-shot cleanup of existing duplicate files"""
@@ -525,7 +819,7 @@ class DuplicateMonitor:
         folders = self.config.get("watched_folders", [])
         if not folders:
             console.print("[red]No folders configured to scan![/red]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
         
         # Show what will be scanned
@@ -543,8 +837,8 @@ class DuplicateMonitor:
         use_time_window = Confirm.ask("\nUse time window check?", default=False)
         
         # Create temporary config for scanning
-        # We'll modify a copy of the current config
-        temp_config = copy.deepcopy(self.config)
+        # Scan-only overrides layered over the current config
+        temp_config = _OverrideConfig(self.config)
         
         if use_time_window:
             current_window = temp_config.get("time_window", 300)
@@ -557,27 +851,40 @@ class DuplicateMonitor:
                                      default=current_formatted)
                 seconds = parse_time_window(time_str)
                 if seconds:
-                    temp_config.config["time_window"] = seconds
+                    temp_config.overrides["time_window"] = seconds
                     console.print(f"[green]Using time window: {format_time_window(seconds)}[/green]")
                     break
                 else:
                     console.print("[red]Invalid format. Use: 5m, 2h, 3d, 1w, 2mo, 1y[/red]")
         else:
-            temp_config.config["check_time"] = False
+            temp_config.overrides["check_time"] = False
         
         # Ask about hash verification
         current_hash = temp_config.get("use_hash", False)
         console.print(f"\nCurrent hash verification: {'ON' if current_hash else 'OFF'}")
         use_hash = Confirm.ask("Use hash verification for this scan?", default=current_hash)
-        temp_config.config["use_hash"] = use_hash
-        
+        temp_config.overrides["use_hash"] = use_hash
+
+        # Without hashing, contents can still be compared directly; it stops at
+        # the first differing byte and needs no digest for a one-off pair
+        compare_bytes = False
         if use_hash:
             algo = temp_config.get("hash_algorithm", "sha256")
             console.print(f"[dim]Using {algo.upper()} algorithm[/dim]")
+        else:
+            compare_bytes = Confirm.ask("Compare file contents byte-for-byte instead?", default=False)
+            temp_config.overrides["compare_bytes"] = compare_bytes
+
+        workers = 1
+        if use_hash or compare_bytes:
+            # Reading file contents dominates a verified scan and releases the GIL
+            default_workers = min(DEFAULT_SCAN_WORKERS, os.cpu_count() or 1)
+            workers = IntPrompt.ask(f"Worker threads (1-{MAX_SCAN_WORKERS})", default=default_workers)
+            workers = max(1, min(MAX_SCAN_WORKERS, workers))
         
         # Dry run option
         dry_run = Confirm.ask("\nRun in dry-run mode?", default=True)
-        temp_config.config["dry_run"] = dry_run
+        temp_config.overrides["dry_run"] = dry_run
         
         if dry_run:
             console.print("[cyan]DRY RUN - No files will be moved[/cyan]")
@@ -588,8 +895,12 @@ class DuplicateMonitor:
         console.print("\n[bold]Detection settings for this scan:[/bold]")
         console.print(f"  • File size check: ON")
         console.print(f"  • Filename pattern: -1, -2, etc.")
-        console.print(f"  • Time window: {'ON (' + format_time_window(temp_config.get('time_window')) + ')' if temp_config.get('check_time') else 'OFF'}")
-        console.print(f"  • Hash verification: {'ON (' + temp_config.get('hash_algorithm').upper() + ')' if temp_config.get('use_hash') else 'OFF'}")
+        scan_time_window = temp_config.get('time_window')
+        scan_hash_algorithm = temp_config.get('hash_algorithm')
+        console.print(f"  • Time window: {'ON (' + format_time_window(scan_time_window) + ')' if temp_config.get('check_time') else 'OFF'}")
+        console.print(f"  • Hash verification: {'ON (' + scan_hash_algorithm.upper() + ')' if use_hash else 'OFF'}")
+        if compare_bytes:
+            console.print(f"  • Content comparison: ON (byte-for-byte)")
         
         if not Confirm.ask("\nProceed with scan?", default=True):
             return
@@ -603,40 +914,88 @@ class DuplicateMonitor:
         
         console.print("\n[yellow]Scanning...[/yellow]\n")
         
-        # Scan each folder
-        for folder in folders:
-            if not os.path.exists(folder):
-                continue
-                
-            console.print(f"Scanning: {folder}")
-            folder_count = 0
-            
-            for root, dirs, files in os.walk(folder):
-                # Find potential duplicates
-                for filename in sorted(files):
-                    # Check if it matches duplicate pattern
-                    if re.search(r'-\d+\.[^.]+$', filename):
-                        total_scanned += 1
-                        file_path = os.path.join(root, filename)
-                        
-                        # Show progress every 10 files
-                        if total_scanned % 10 == 0:
-                            console.print(f"  [dim]Checked {total_scanned} files...[/dim]")
-                        
-                        # Use the handler's duplicate detection
-                        # We need to check if this file has an original
-                        base_name = re.sub(r'-\d+(\.[^.]+)$', r'\1', filename)
-                        original_path = os.path.join(root, base_name)
-                        
-                        if os.path.exists(original_path):
-                            # Original exists, let handler check if it's a duplicate
-                            scanner._handle_duplicate(file_path)
-                            folder_count += 1
-            
-            if folder_count > 0:
-                console.print(f"  → Found {folder_count} potential duplicates")
-                duplicates_found += folder_count
-        
+        # Don't rescan our own quarantine if it sits inside a watched folder
+        skip_dirs = {os.path.normcase(os.path.abspath(self.config.get("quarantine_path")))}
+
+        # Only the cleanup scan shows a progress display
+        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+        # Comparisons run on worker threads; moves stay on this thread.
+        # A live status line replaces printing a progress message per batch.
+        progress = Progress(SpinnerColumn(), TextColumn("{task.description}"), TimeElapsedColumn(),
+                            console=console, transient=True)
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as executor, progress:
+                task = progress.add_task("Scanning...", total=None)
+                # Scan each folder
+                for folder in folders:
+                    if not os.path.exists(folder):
+                        continue
+
+                    console.print(f"Scanning: {folder}")
+                    folder_count = 0
+                    candidates = []
+
+                    # Names are matched straight from the directory listing; nothing
+                    # is stat'ed unless it looks like a numbered copy
+                    for entry in scan_files(folder, skip_dirs, SCAN_SKIP_DIR_NAMES):
+                        # Check if it matches duplicate pattern
+                        match = DUPLICATE_SUFFIX_RE.search(entry.name)
+                        if match:
+                            total_scanned += 1
+                            file_path = entry.path
+
+                            if total_scanned % SCAN_PROGRESS_EVERY == 0:
+                                progress.update(task, description=f"Checked {total_scanned} files...")
+
+                            # Use the handler's duplicate detection
+                            # We need to check if this file has an original
+                            base_name = entry.name[:match.start()] + match.group(1)
+                            original_path = os.path.join(os.path.dirname(file_path), base_name)
+
+                            if os.path.exists(original_path):
+                                # Original exists, let handler check if it's a duplicate
+                                try:
+                                    candidates.append((entry.inode(), file_path))
+                                except FileNotFoundError:
+                                    continue
+                                folder_count += 1
+
+                    # Hash in inode order, which on most filesystems tracks on-disk
+                    # layout and keeps spinning disks reading mostly forward
+                    candidates.sort()
+                    pending = [(file_path, executor.submit(scanner._find_original, file_path))
+                               for _, file_path in candidates]
+
+                    # Moves run one at a time in submission order. A match found on a
+                    # worker was judged against the folder as it was before any move,
+                    # so numbered copies can pick each other as the original; one
+                    # whose original has been quarantined in this pass is checked
+                    # again against what is left.
+                    quarantined: Set[str] = set()
+                    for file_path, future in pending:
+                        try:
+                            original = future.result()
+                            if original and (original in quarantined or not os.path.exists(original)):
+                                original = scanner._find_original(file_path, exclude=quarantined)
+                        except FileNotFoundError:
+                            scanner.logger.info(f"SKIPPED: {file_path} no longer exists")
+                            continue
+                        except (OSError, sqlite3.Error) as e:
+                            # An unreadable file or a busy cache costs this file, not the scan
+                            scanner.logger.error(f"FAILED - Error checking {file_path}: {str(e)}")
+                            continue
+                        if original:
+                            scanner.quarantine_duplicate(file_path, original)
+                            quarantined.add(file_path)
+
+                    if folder_count > 0:
+                        console.print(f"  → Found {folder_count} potential duplicates")
+                        duplicates_found += folder_count
+        finally:
+            # Save the scan's digests and stop its log listener even if it was cut short
+            scanner.close()
+
         # Summary
         console.print(f"\n[bold]Scan Complete[/bold]")
         console.print(f"Files scanned: {total_scanned}")
@@ -645,65 +1004,43 @@ class DuplicateMonitor:
         if dry_run and duplicates_found > 0:
             console.print("\n[cyan]This was a dry run. To actually move files, run again with dry-run OFF.[/cyan]")
         
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def view_quarantine(self):
         """View quarantined files with path structure"""
+        cprint = console.print
         while True:
             console.clear()
-            console.print("\n[bold]Quarantine Folder[/bold]\n")
+            cprint("\n[bold]Quarantine Folder[/bold]\n")
 
             quarantine_path = self.config.get("quarantine_path")
             if not os.path.exists(quarantine_path):
-                console.print("[yellow]Quarantine folder is empty[/yellow]")
-                input("\nPress Enter to continue...")
+                cprint("[yellow]Quarantine folder is empty[/yellow]")
+                self._pause()
                 return
             else:
                 # Count files and show structure
-                total_files = 0
-                total_size = 0
-                file_tree = {}
-
-                for root, dirs, files in os.walk(quarantine_path):
-                    for file in files:
-                        if not file.endswith('.restore_info'):
-                            total_files += 1
-                            file_path = os.path.join(root, file)
-                            total_size += os.path.getsize(file_path)
-
-                            # Build tree structure
-                            rel_path = os.path.relpath(file_path, quarantine_path)
-                            parts = rel_path.split(os.sep)
-
-                            if len(parts) >= 2:  # Has date and possibly more structure
-                                date = parts[0]
-                                if date not in file_tree:
-                                    file_tree[date] = []
-                                file_tree[date].append(os.sep.join(parts[1:]))
-
-                console.print(f"Location: {quarantine_path}")
-                console.print(f"Total files: {total_files}")
-                console.print(f"Total size: {format_size(total_size)}")
+                total_files, total_size, file_tree = self._quarantine_summary(quarantine_path)
+                cprint(f"Location: {quarantine_path}")
+                cprint(f"Total files: {total_files}")
+                cprint(f"Total size: {format_size(total_size)}")
 
                 # Show recent quarantined files by date
                 if file_tree:
-                    console.print("\n[bold]Quarantined files by date:[/bold]")
+                    cprint("\n[bold]Quarantined files by date:[/bold]")
 
                     # Sort dates in reverse order (newest first)
                     for date in sorted(file_tree.keys(), reverse=True)[:5]:  # Show last 5 days
-                        console.print(f"\n[cyan]{date}:[/cyan]")
+                        cprint(f"\n[cyan]{date}:[/cyan]")
                         for file_path in file_tree[date][:10]:  # Show up to 10 files per date
-                            console.print(f"  → {file_path}")
+                            cprint(f"  → {file_path}")
 
                         if len(file_tree[date]) > 10:
-                            console.print(f"  [dim]... and {len(file_tree[date]) - 10} more files[/dim]")
+                            cprint(f"  [dim]... and {len(file_tree[date]) - 10} more files[/dim]")
 
             # Options
-            console.print("\n1. View restoration info for a file")
-            console.print("2. Restore a file")
-            console.print("3. Clean old quarantined files\n")
-
-            console.print("0. Back\n")
+            for option in _QUARANTINE_MENU:
+                cprint(option)
 
             choice = Prompt.ask("Select option", choices=["1","2","3","0"], default="0")
 
@@ -716,84 +1053,140 @@ class DuplicateMonitor:
             elif choice == "0":
                 return
 
+    def _quarantine_summary(self, quarantine_path: str) -> Tuple[int, int, Dict[str, List[str]]]:
+        """Count quarantined files and group them by date folder"""
+        total_files = 0
+        total_size = 0
+        file_tree: Dict[str, List[str]] = defaultdict(list)
+        prefix_len = len(os.path.join(quarantine_path, ''))
+
+        for entry in scan_files(quarantine_path):
+            if entry.name.endswith('.restore_info'):
+                continue
+            total_files += 1
+            total_size += entry.stat(follow_symlinks=False).st_size
+
+            # Build tree structure: date folder -> rest of the path
+            date, sep, rest = entry.path[prefix_len:].partition(os.sep)
+            if sep:  # Has date and possibly more structure
+                file_tree[date].append(rest)
+
+        return total_files, total_size, file_tree
+
     def _view_restoration_info(self):
         """View restoration info for a specific file"""
         filename = Prompt.ask("\nEnter filename to check")
 
-        quarantine_path = self.config.get("quarantine_path")
         found = False
 
-        for root, dirs, files in os.walk(quarantine_path):
-            for file in files:
-                if file == filename and not file.endswith('.restore_info'):
-                    info_file = os.path.join(root, file + '.restore_info')
-                    if os.path.exists(info_file):
-                        console.print(f"\n[bold]Restoration info for {filename}:[/bold]")
-                        with open(info_file, 'r') as f:
-                            console.print(f.read())
-                        found = True
-                        break
+        for quarantined_file in self._find_in_quarantine(filename):
+            info_file = quarantined_file + '.restore_info'
+            console.print(f"\n[bold]Restoration info for {filename}:[/bold]")
+            with open(info_file, 'r') as f:
+                console.print(f.read())
+            found = True
 
         if not found:
             console.print("[yellow]File not found in quarantine[/yellow]")
 
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def _restore_file(self):
         """Restore a quarantined file to its original location"""
         console.print("\n[yellow]Note: This will restore the file to its original location[/yellow]")
         filename = Prompt.ask("Enter filename to restore")
 
-        quarantine_path = self.config.get("quarantine_path")
         found = False
 
-        for root, dirs, files in os.walk(quarantine_path):
-            for file in files:
-                if file == filename and not file.endswith('.restore_info'):
-                    quarantined_file = os.path.join(root, file)
-                    info_file = quarantined_file + '.restore_info'
-
-                    if os.path.exists(info_file):
-                        # Read original path
-                        with open(info_file, 'r') as f:
-                            lines = f.readlines()
-                            original_path = lines[0].replace('Original path: ', '').strip()
+        for quarantined_file in self._find_in_quarantine(filename):
+            info_file = quarantined_file + '.restore_info'
 
-                        console.print(f"\nOriginal location: {original_path}")
+            # Read original path from the header
+            with open(info_file, 'r') as f:
+                match = _RESTORE_ORIGINAL_RE.search(f.read(RESTORE_INFO_READ_LIMIT))
+            found = True
+            if not match:
+                console.print(f"[red]No original path recorded in {info_file}[/red]")
+                continue
+            original_path = match.group(1).strip()
 
-                        if Confirm.ask("Restore this file?", default=False):
-                            try:
-                                # Create directory if needed
-                                os.makedirs(os.path.dirname(original_path), exist_ok=True)
+            console.print(f"\nOriginal location: {original_path}")
 
-                                # Move file back
-                                shutil.move(quarantined_file, original_path)
+            if Confirm.ask("Restore this file?", default=False):
+                try:
+                    # Create directory if needed
+                    original_dir = os.path.dirname(original_path)
+                    if not os.path.isdir(original_dir):
+                        os.makedirs(original_dir, exist_ok=True)
+
+                    # Move file back (a single rename when on the same filesystem)
+                    move_file(quarantined_file, original_path)
+
+                    # Remove info file
+                    os.remove(info_file)
+                    self._get_quarantine_catalog().remove(quarantined_file)
+
+                    console.print(f"[green]File restored to: {original_path}[/green]")
+                    if self.handler:
+                        self.handler.logger.info(f"RESTORED: {quarantined_file} -> {original_path}")
+                except Exception as e:
+                    console.print(f"[red]Error restoring file: {e}[/red]")
+                    if self.handler:
+                        self.handler.logger.error(f"RESTORE FAILED: {quarantined_file} -> {original_path}: {e}")
 
-                                # Remove info file
-                                os.remove(info_file)
+        if not found:
+            console.print("[yellow]File not found in quarantine[/yellow]")
 
-                                console.print(f"[green]File restored to: {original_path}[/green]")
-                                if self.handler:
-                                    self.handler.logger.info(f"RESTORED: {quarantined_file} -> {original_path}")
-                            except Exception as e:
-                                console.print(f"[red]Error restoring file: {e}[/red]")
-                                if self.handler:
-                                    self.handler.logger.error(f"RESTORE FAILED: {quarantined_file} -> {original_path}: {e}")
+        self._pause()
 
-                        found = True
-                        break
+    def _find_in_quarantine(self, filename: str) -> List[str]:
+        """Find quarantined files with restoration info by filename
 
-        if not found:
-            console.print("[yellow]File not found in quarantine[/yellow]")
+        Looks the name up in the persistent quarantine catalog, which the
+        handler adds to as it quarantines files. Files can also be removed or
+        added by hand, so a miss or a stale hit rescans the quarantine into the
+        catalog once before giving up.
+        """
+        quarantine_path = self.config.get("quarantine_path")
+        catalog = self._get_quarantine_catalog()
+        fresh = False
+        if not catalog.is_indexed(quarantine_path):
+            self._rebuild_quarantine_catalog(quarantine_path)
+            fresh = True
 
-        input("\nPress Enter to continue...")
+        while True:
+            paths = catalog.lookup(quarantine_path, filename)
+            found = [p for p in paths if os.path.exists(p + '.restore_info')]
+            if (found and len(found) == len(paths)) or fresh:
+                return found
+            self._rebuild_quarantine_catalog(quarantine_path)
+            fresh = True
+
+    def _get_quarantine_catalog(self) -> QuarantineCatalog:
+        """Open the quarantine catalog on first use"""
+        if self._quarantine_catalog is None:
+            self._quarantine_catalog = QuarantineCatalog(
+                os.path.join(self.config.config_dir, "quarantine.sqlite"))
+        return self._quarantine_catalog
+
+    def _rebuild_quarantine_catalog(self, quarantine_path: str):
+        """Record every quarantined file that has a .restore_info sidecar in the catalog"""
+        # Sidecars are matched from the same listing instead of an exists() per file
+        files = set()
+        info_files = set()
+        for entry in scan_files(quarantine_path):
+            if entry.name.endswith('.restore_info'):
+                info_files.add(entry.path[:-len('.restore_info')])
+            else:
+                files.add(entry.path)
+        self._get_quarantine_catalog().replace(quarantine_path, files & info_files)
 
     def _clean_old_quarantine(self):
         """Clean quarantined files older than configured days"""
         days = self.config.get("delete_after_days")
         if days == 0:
             console.print("[yellow]Auto-delete is disabled (set to 0 days)[/yellow]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
 
         cutoff_date = datetime.now() - timedelta(days=days)
@@ -803,69 +1196,102 @@ class DuplicateMonitor:
             return
 
         quarantine_path = self.config.get("quarantine_path")
+        errors: List[Tuple[str, str]] = []
+        # Unlinks are latency-bound on network and cloud-synced folders, so
+        # several are kept in flight at once
+        with ThreadPoolExecutor(max_workers=CLEANUP_DELETE_WORKERS, thread_name_prefix="clean") as executor:
+            deleted_count, deleted_size = self._clean_quarantine_tree(
+                quarantine_path, cutoff_date.timestamp(), time.time(), executor, errors
+            )
+
+        # Failures are reported together once the tree has been processed
+        if errors:
+            table = Table(show_header=True, header_style="bold red", box=None)
+            table.add_column("Could not delete")
+            table.add_column("Error")
+            for name, message in errors:
+                table.add_row(escape(name), escape(message))
+            console.print(table)
+
+        console.print(f"\n[green]Cleaned {deleted_count} files ({format_size(deleted_size)})[/green]")
+        if self.handler:
+            self.handler.logger.info(f"CLEANUP: {deleted_count} files deleted ({format_size(deleted_size)}), "
+                                     f"{len(errors)} failed")
+        self._pause()
+
+    def _clean_quarantine_tree(self, path: str, cutoff_ts: float, now_ts: float,
+                               executor: ThreadPoolExecutor,
+                               errors: List[Tuple[str, str]]) -> Tuple[int, int]:
+        """Delete files modified before cutoff_ts below path, then remove emptied folders
+
+        Recurses with os.scandir so each file's age and size come from a single
+        DirEntry.stat() call. Deletions run on executor and are collected before
+        returning, so a folder is empty by the time its parent tries to remove it.
+        Failures are appended to errors as (path, message). Returns
+        (deleted_count, deleted_size).
+        """
         deleted_count = 0
         deleted_size = 0
 
-        for root, dirs, files in os.walk(quarantine_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-
-                # Check file age
-                mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-                if mtime < cutoff_date:
-                    try:
-                        size = os.path.getsize(file_path)
-                        os.remove(file_path)
-                        deleted_count += 1
-                        deleted_size += size
-                        if self.handler:
-                            self.handler.logger.info(f"CLEANED: {file_path} (age: {(datetime.now() - mtime).days} days)")
-                    except Exception as e:
-                        console.print(f"[red]Error deleting {file}: {e}[/red]")
-
-        # Clean empty directories
-        for root, dirs, files in os.walk(quarantine_path, topdown=False):
-            if not dirs and not files and root != quarantine_path:
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return 0, 0
+
+        removals = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                count, size = self._clean_quarantine_tree(entry.path, cutoff_ts, now_ts,
+                                                          executor, errors)
+                deleted_count += count
+                deleted_size += size
+
+                # Remove the folder if that left it empty (rmdir fails otherwise)
                 try:
-                    os.rmdir(root)
-                except:
+                    os.rmdir(entry.path)
+                except OSError:
                     pass
+                continue
 
-        console.print(f"\n[green]Cleaned {deleted_count} files ({format_size(deleted_size)})[/green]")
-        input("\nPress Enter to continue...")
+            try:
+                # Check file age
+                stat_info = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                errors.append((entry.path, str(e)))
+                continue
+            if stat_info.st_mtime < cutoff_ts:
+                removals.append((entry, stat_info, executor.submit(os.remove, entry.path)))
+
+        for entry, stat_info, future in removals:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append((entry.path, str(e)))
+                continue
+            deleted_count += 1
+            deleted_size += stat_info.st_size
+            if self.handler:
+                age_days = int((now_ts - stat_info.st_mtime) // 86400)
+                self.handler.logger.info(f"CLEANED: {entry.path} (age: {age_days} days)")
+
+        return deleted_count, deleted_size
 
     def view_statistics(self):
         """View monitoring statistics and logs"""
+        cprint = console.print
         while True:
             console.clear()
-            console.print("\n[bold]Monitoring Statistics & Logs[/bold]\n")
+            cprint("\n[bold]Monitoring Statistics & Logs[/bold]\n")
 
             # Get session statistics if monitoring
             if self.monitoring and self.handler:
-                stats = self.handler.get_statistics()
-
-                # Display statistics table
-                table = Table(show_header=False, box=None)
-                table.add_column("Metric", style="cyan")
-                table.add_column("Value")
-
-                table.add_row("Session Started", stats["session_start"].strftime("%Y-%m-%d %H:%M:%S"))
-                table.add_row("Uptime", str(stats["uptime"]).split('.')[0])  # Remove microseconds
-                table.add_row("Files Checked", str(stats["files_checked"]))
-                table.add_row("Duplicates Found", str(stats["duplicates_found"]))
-                table.add_row("Success Rate", f"{stats['success_rate']:.1f}%")
-
-                console.print(table)
-                console.print("")
+                cprint(self._statistics_table())
+                cprint("")
 
             # Log viewing options
-            console.print("1. View recent activity (last 20 entries)")
-            console.print("2. View errors and warnings only")
-            console.print("3. View detailed debug log")
-            console.print("4. Search logs")
-            console.print("5. Export logs")
-            console.print("6. Clear old logs\n")
-            console.print("0. Back to main menu\n")
+            for option in _STATISTICS_MENU:
+                cprint(option)
 
             choice = Prompt.ask("Select option", choices=["1","2","3","4","5","6","0"])
 
@@ -884,43 +1310,50 @@ class DuplicateMonitor:
             elif choice == "0":
                 break
 
+    def _statistics_table(self) -> Table:
+        """Build the session statistics table, reusing it until a shown value changes"""
+        stats = self.handler.get_statistics()
+        uptime = str(stats["uptime"]).split('.')[0]  # Remove microseconds
+        key = (self.handler, uptime, stats["files_checked"], stats["duplicates_found"])
+        if self._stats_table and self._stats_table[0] == key:
+            return self._stats_table[1]
+
+        table = Table(show_header=False, box=None)
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value")
+
+        table.add_row("Session Started", stats["session_start"].strftime("%Y-%m-%d %H:%M:%S"))
+        table.add_row("Uptime", uptime)
+        table.add_row("Files Checked", str(stats["files_checked"]))
+        table.add_row("Duplicates Found", str(stats["duplicates_found"]))
+        table.add_row("Success Rate", f"{stats['success_rate']:.1f}%")
+
+        self._stats_table = (key, table)
+        return table
+
     def _view_recent_logs(self):
         """View recent log entries"""
         log_file = self.config.get("log_file")
         if not os.path.exists(log_file):
             console.print("[yellow]No log file found yet[/yellow]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
 
         console.print("\n[bold]Recent Activity:[/bold]\n")
 
         # Read last 20 lines
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-
-        for line in lines[-20:]:
-            line = line.strip()
-            if "ERROR" in line or "FAILED" in line:
-                console.print(f"[red]{line}[/red]")
-            elif "WARNING" in line:
-                console.print(f"[yellow]{line}[/yellow]")
-            elif "DUPLICATE CONFIRMED" in line or "QUARANTINED" in line:
-                console.print(f"[green]{line}[/green]")
-            elif "NO DUPLICATE" in line:
-                console.print(f"[blue]{line}[/blue]")
-            elif "DRY RUN" in line:
-                console.print(f"[cyan]{line}[/cyan]")
-            else:
-                console.print(line)
+        console.print(_log_text(tail_lines(log_file, 20)))
 
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def _view_error_logs(self):
         """View only errors and warnings"""
         log_file = self.config.get("log_file")
-        if not os.path.exists(log_file):
+        try:
+            lines = self._error_log_lines(log_file)
+        except FileNotFoundError:
             console.print("[yellow]No log file found yet[/yellow]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
 
         console.print("\n[bold]Errors and Warnings:[/bold]\n")
@@ -928,58 +1361,121 @@ class DuplicateMonitor:
         error_count = 0
         warning_count = 0
 
-        with open(log_file, 'r') as f:
-            for line in f:
-                if "ERROR" in line or "FAILED" in line:
-                    console.print(f"[red]{line.strip()}[/red]")
-                    error_count += 1
-                elif "WARNING" in line:
-                    console.print(f"[yellow]{line.strip()}[/yellow]")
-                    warning_count += 1
+        # Render styled lines a batch at a time instead of one print per line
+        batch = []
+        for line in lines:
+            style = _log_line_style(line)
+            if style == "red":
+                error_count += 1
+            elif style == "yellow":
+                warning_count += 1
+            else:
+                continue
+            batch.append(f"[{style}]{escape(line.strip())}[/{style}]")
+            if len(batch) >= SEARCH_OUTPUT_BATCH:
+                console.print("\n".join(batch))
+                batch.clear()
+        if batch:
+            console.print("\n".join(batch))
 
         console.print(f"\nTotal: {error_count} errors, {warning_count} warnings")
-        input("\nPress Enter to continue...")
+        self._pause()
+
+    def _error_log_lines(self, log_file: str) -> List[str]:
+        """Get the log's error and warning lines, scanning only what was appended
+
+        Matches are kept with the log's identity and how far it has been scanned.
+        A line still being written is left for the next call. A rotated,
+        replaced or truncated log is scanned again from the start.
+        """
+        stat_info = os.stat(log_file)
+        key = (log_file, stat_info.st_dev, stat_info.st_ino)
+        cached = self._error_lines_cache
+        if cached and cached[0] == key and cached[1] <= stat_info.st_size:
+            scanned, lines = cached[1], cached[2]
+        else:
+            scanned, lines = 0, []
+        end = line_start(log_file, stat_info.st_size)
+        lines.extend(grep_lines(log_file, _ERROR_LINE_RE, start=scanned, end=end))
+        self._error_lines_cache = (key, end, lines)
+        return lines
 
     def _view_debug_logs(self):
         """View detailed debug information"""
         log_file = self.config.get("log_file")
         if not os.path.exists(log_file):
             console.print("[yellow]No log file found yet[/yellow]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
 
         console.print("\n[bold]Debug Log (last 50 entries):[/bold]\n")
 
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
-
         # Show last 50 lines with all details
-        for line in lines[-50:]:
-            console.print(line.strip())
+        console.print(_log_text(tail_lines(log_file, 50), styled=False))
 
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def _search_logs(self):
         """Search through logs"""
         search_term = Prompt.ask("\nEnter search term")
 
+        # Optional time range; the log is in time order, so it is bisected
+        console.print("[dim]Limit to a time range with YYYY-MM-DD [HH:MM[:SS]], or press Enter to skip[/dim]")
+        try:
+            since = _log_stamp(Prompt.ask("From", default=""))
+            until = _log_stamp(Prompt.ask("To", default=""))
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            self._pause()
+            return
+
         log_file = self.config.get("log_file")
-        if not os.path.exists(log_file):
+        try:
+            # Plain searches go to grep/rg when installed; time ranges need the
+            # bisecting scanner below
+            lines = None
+            if since is None and until is None:
+                lines = _tool_search_lines(log_file, search_term)
+            if lines is None and search_term.isascii():
+                # Let the regex engine skip non-matching bytes in the mapped file
+                pattern = re.compile(re.escape(search_term.encode('ascii')), re.IGNORECASE)
+                lines = grep_lines(log_file, pattern, since, until)
+            elif lines is None:
+                # Bytes IGNORECASE only folds ASCII, so compare decoded lines instead;
+                # casefold handles the cases lower() misses (e.g. ß vs SS)
+                needle = search_term.casefold()
+                lines = _casefold_search_lines(
+                    iter_line_blocks(log_file), needle,
+                    since.decode('ascii') if since else None,
+                    until.decode('ascii') if until else None,
+                )
+        except FileNotFoundError:
             console.print("[yellow]No log file found yet[/yellow]")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
 
         console.print(f"\n[bold]Search results for '{search_term}':[/bold]\n")
 
         matches = 0
-        with open(log_file, 'r') as f:
-            for line in f:
-                if search_term.lower() in line.lower():
-                    console.print(line.strip())
-                    matches += 1
+
+        # Log text is plain, so write batches straight to the console's file
+        # rather than through Rich's markup and layout rendering
+        write = console.file.write
+        batch = []
+        for line in lines:
+            batch.append(line.strip())
+            matches += 1
+            if len(batch) >= SEARCH_OUTPUT_BATCH:
+                batch.append("")
+                write("\n".join(batch))
+                batch.clear()
+        if batch:
+            batch.append("")
+            write("\n".join(batch))
+        console.file.flush()
 
         console.print(f"\nFound {matches} matches")
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def _export_logs(self):
         """Export logs to a file"""
@@ -987,39 +1483,55 @@ class DuplicateMonitor:
         export_path = f"duplicate_monitor_export_{timestamp}.log"
 
         log_file = self.config.get("log_file")
-        if not os.path.exists(log_file):
-            console.print("[yellow]No log file to export[/yellow]")
-            input("\nPress Enter to continue...")
-            return
-
         try:
-            shutil.copy2(log_file, export_path)
+            # A fresh export needs the log's data, not its timestamps or mode
+            copy_file(log_file, export_path, metadata=False)
             console.print(f"[green]Logs exported to: {export_path}[/green]")
+        except FileNotFoundError:
+            console.print("[yellow]No log file to export[/yellow]")
         except Exception as e:
             console.print(f"[red]Export failed: {e}[/red]")
 
-        input("\nPress Enter to continue...")
+        self._pause()
 
     def _clear_old_logs(self):
         """Clear old log entries"""
         if Confirm.ask("\nAre you sure you want to clear old logs?", default=False):
             log_file = self.config.get("log_file")
 
-            # Backup current log first
-            if os.path.exists(log_file):
-                backup_name = log_file + ".backup"
-                shutil.copy2(log_file, backup_name)
+            # Backup current log first. Renaming it aside avoids copying the data,
+            # but only this process's logger can be told to reopen its file: a
+            # monitor running in another process (e.g. --start) would keep
+            # appending to the backup. Windows also can't rename a file the
+            # logger still has open. Otherwise copy, then truncate in place,
+            # which other processes' append-mode writers follow.
+            backup_name = log_file + ".backup"
+            rename_aside = self._lock_fd is not None and os.name != 'nt'
+            try:
+                if rename_aside:
+                    os.replace(log_file, backup_name)
+                else:
+                    copy_file(log_file, backup_name)
+            except FileNotFoundError:
+                console.print("[yellow]No log file to clear[/yellow]")
+            else:
                 console.print(f"[green]Backup created: {backup_name}[/green]")
 
                 # Clear the log file
                 with open(log_file, 'w') as f:
                     f.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | INFO     | Log file cleared\n")
 
+                # Truncating in place keeps the log's identity, so the error
+                # view's scan offset has to be dropped by hand
+                self._error_lines_cache = None
+
+                # After a rename, our logger would otherwise keep appending to the backup
+                if rename_aside and self.handler:
+                    self.handler.reopen_log_files()
+
                 console.print("[green]Log file cleared[/green]")
-            else:
-                console.print("[yellow]No log file to clear[/yellow]")
 
-        input("\nPress Enter to continue...")
+        self._pause()
 
 
 def main():
@@ -1058,30 +1570,37 @@ def main():
             
             # Use tail to show last 1000 lines and follow
             cmd = ['tail', '-n', '1000', '-f', log_file]
+            import subprocess
+            # On a terminal, awk colors the lines inside the pipeline so Python
+            # isn't styling and printing every line of a busy log
+            awk = shutil.which('awk') if console.is_terminal else None
+            colorizer = None
             try:
-                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
-                
-                # Process each line as it comes
-                for line in proc.stdout:
-                    line = line.strip()
-                    if line:  # Skip empty lines
-                        if "ERROR" in line or "FAILED" in line:
-                            console.print(f"[red]{line}[/red]")
-                        elif "WARNING" in line:
-                            console.print(f"[yellow]{line}[/yellow]")
-                        elif "DUPLICATE CONFIRMED" in line or "QUARANTINED" in line:
-                            console.print(f"[green]{line}[/green]")
-                        elif "NO DUPLICATE" in line:
-                            console.print(f"[blue]{line}[/blue]")
-                        elif "DRY RUN" in line:
-                            console.print(f"[cyan]{line}[/cyan]")
-                        else:
-                            console.print(line)
-                            
+                if awk:
+                    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                    awk_cmd = [awk, _awk_color_program()]
+                    # mawk reads pipes in large blocks unless told the input is interactive
+                    if os.path.basename(os.path.realpath(awk)).startswith('mawk'):
+                        awk_cmd[1:1] = ['-W', 'interactive']
+                    colorizer = subprocess.Popen(awk_cmd, stdin=proc.stdout)
+                    proc.stdout.close()
+                    colorizer.wait()
+                else:
+                    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
+
+                    # Process each line as it comes
+                    for line in proc.stdout:
+                        line = line.strip()
+                        if line:  # Skip empty lines
+                            style = _log_line_style(line)
+                            console.print(f"[{style}]{line}[/{style}]" if style else line)
+
             except KeyboardInterrupt:
                 console.print("\n[yellow]Stopped following log[/yellow]")
                 proc.terminate()
                 proc.wait()  # Wait for process to actually terminate
+                if colorizer is not None:
+                    colorizer.wait()
             except FileNotFoundError:
                 console.print("[red]Error: 'tail' command not found. This feature requires tail to be installed.[/red]")
         else:
@@ -1105,12 +1624,16 @@ def main():
         if args.start:
             if monitor.config.get("watched_folders"):
                 monitor.start_monitoring()
-                console.print("\n[yellow]Press Ctrl+C to stop monitoring and return to menu[/yellow]")
-                try:
-                    while monitor.monitoring:
-                        time.sleep(1)
-                except KeyboardInterrupt:
-                    monitor.stop_monitoring()
+                # Start-up can decline, e.g. when another instance holds the lock
+                if monitor.monitoring:
+                    console.print("\n[yellow]Press Ctrl+C to stop monitoring and return to menu[/yellow]")
+                    # Windows only delivers Ctrl+C between waits, so wake it periodically
+                    wait_timeout = 1 if sys.platform == 'win32' else None
+                    try:
+                        while not monitor._stop_event.wait(wait_timeout):
+                            pass
+                    except KeyboardInterrupt:
+                        monitor.stop_monitoring()
             else:
                 console.print("[red]No folders configured to watch![/red]")
                 console.print("Please configure folders first.\n")
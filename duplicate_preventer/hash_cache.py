@@ -0,0 +1,119 @@
+"""
+Persistent file hash cache for Duplicate File Preventer
+Stores digests keyed by path, size and modification time across sessions
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from .utils import hash_file
+
+# Pending inserts before the cache is committed to disk
+COMMIT_EVERY = 500
+
+# Longest (seconds) an insert is held in an open write transaction; another
+# process writing the same cache waits for it
+COMMIT_INTERVAL = 1.0
+
+# Seconds to wait for another connection's write lock before giving up;
+# comfortably longer than another writer's COMMIT_INTERVAL
+DB_TIMEOUT = 5.0
+
+
+class HashCache:
+    """SQLite-backed cache of file digests, invalidated by size or mtime change
+
+    The cache is only an accelerator: a lookup or write that fails (e.g. the
+    database stayed locked by another process) counts as a miss.
+    """
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._pending_since = 0.0
+        self._conn = sqlite3.connect(db_path, timeout=DB_TIMEOUT, check_same_thread=False)
+        # WAL keeps lookups from blocking on commits; NORMAL skips an fsync per commit
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, algo TEXT, digest TEXT)"
+        )
+        self._conn.commit()
+
+    def get_hash(self, file_path: str, algorithm: str,
+                 stat_info: Optional[os.stat_result] = None) -> str:
+        """Return the file's digest, computing it only if the cached one is stale"""
+        if stat_info is None:
+            stat_info = os.stat(file_path)
+        digest = self._cached(file_path, stat_info, algorithm)
+        if digest is None:
+            digest = hash_file(file_path, algorithm)
+            self.store(file_path, stat_info, algorithm, digest)
+        return digest
+
+    def lookup(self, file_path: str, algorithm: str,
+               stat_info: Optional[os.stat_result] = None) -> Optional[str]:
+        """Return the cached digest if it is still current, without hashing"""
+        if stat_info is None:
+            stat_info = os.stat(file_path)
+        return self._cached(file_path, stat_info, algorithm)
+
+    def store(self, file_path: str, stat_info: os.stat_result, algorithm: str,
+              digest: str) -> None:
+        """Cache a digest computed elsewhere for the file as it was at stat_info"""
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, algo, digest) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (file_path, stat_info.st_size, stat_info.st_mtime_ns, algorithm, digest)
+                )
+            except sqlite3.Error:
+                # Don't leave a failed statement's transaction (and its stale
+                # snapshot) open; the pending entries are just cache misses later
+                self._conn.rollback()
+                self._pending = 0
+                return
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending += 1
+            if (self._pending >= COMMIT_EVERY
+                    or time.monotonic() - self._pending_since >= COMMIT_INTERVAL):
+                self._commit()
+
+    def _cached(self, file_path: str, stat_info: os.stat_result, algorithm: str) -> Optional[str]:
+        """Get the stored digest if size, mtime and algorithm still match"""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, algo, digest FROM hashes WHERE path = ?",
+                    (file_path,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row and row[:3] == (stat_info.st_size, stat_info.st_mtime_ns, algorithm):
+            return row[3]
+        return None
+
+    def _commit(self) -> None:
+        """Commit pending entries, dropping them if the database stays locked"""
+        try:
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.rollback()
+        self._pending = 0
+
+    def flush(self) -> None:
+        """Commit entries written since the last commit"""
+        with self._lock:
+            if self._pending:
+                self._commit()
+
+    def close(self) -> None:
+        """Commit outstanding entries and close the database"""
+        with self._lock:
+            self._commit()
+            self._conn.close()
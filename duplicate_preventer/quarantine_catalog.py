@@ -0,0 +1,79 @@
+"""
+Persistent quarantine catalog for Duplicate File Preventer
+Maps quarantined filenames to their paths so lookups don't walk the quarantine
+"""
+import os
+import sqlite3
+import threading
+from typing import Iterable, List
+
+
+class QuarantineCatalog:
+    """SQLite index of quarantined files by name, per quarantine folder
+
+    Rows are hints, not the source of truth: callers check that a returned
+    path still exists and rebuild the folder's rows from a scan when it doesn't.
+    """
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL lets the monitor and the menu hold connections side by side
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS quarantine ("
+            "path TEXT PRIMARY KEY, root TEXT, name TEXT)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS quarantine_name ON quarantine (root, name)"
+        )
+        # Quarantine folders whose contents have been fully scanned in at least once
+        self._conn.execute("CREATE TABLE IF NOT EXISTS roots (root TEXT PRIMARY KEY)")
+        self._conn.commit()
+
+    def add(self, root: str, path: str) -> None:
+        """Record a file moved into the quarantine folder root"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quarantine (path, root, name) VALUES (?, ?, ?)",
+                (path, root, os.path.basename(path))
+            )
+            self._conn.commit()
+
+    def remove(self, path: str) -> None:
+        """Forget a file that has left the quarantine"""
+        with self._lock:
+            self._conn.execute("DELETE FROM quarantine WHERE path = ?", (path,))
+            self._conn.commit()
+
+    def is_indexed(self, root: str) -> bool:
+        """Check whether root's existing contents have been scanned in"""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM roots WHERE root = ?", (root,)).fetchone()
+        return row is not None
+
+    def lookup(self, root: str, name: str) -> List[str]:
+        """Return the recorded paths of files with this name under root"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM quarantine WHERE root = ? AND name = ? ORDER BY path",
+                (root, name)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def replace(self, root: str, paths: Iterable[str]) -> None:
+        """Replace everything recorded under root with the given paths"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM quarantine WHERE root = ?", (root,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO quarantine (path, root, name) VALUES (?, ?, ?)",
+                    ((path, root, os.path.basename(path)) for path in paths)
+                )
+                self._conn.execute("INSERT OR IGNORE INTO roots (root) VALUES (?)", (root,))
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
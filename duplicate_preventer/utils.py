@@ -2,10 +2,27 @@
 Utility functions for Duplicate File Preventer
 Shared functions used across modules
 """
+import errno
+import hashlib
+import mmap
 import os
 import re
+import shutil
+import sys
+import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Any, Iterator, List, Optional, Pattern, Tuple, Union
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 
 def clean_path(path: str) -> str:
@@ -26,11 +43,19 @@ def clean_path(path: str) -> str:
     return path
 
 
+# Common cloud folder names that root a quarantine subpath
+RELATIVE_PATH_ROOTS = frozenset({"Dropbox", "OneDrive", "Google Drive", "iCloud Drive"})
+
+# First directory component named after one of RELATIVE_PATH_ROOTS
+_RELATIVE_ROOT_RE = re.compile(
+    r'(?:^|{sep})((?:{names})){sep}'.format(
+        sep=re.escape(os.sep),
+        names='|'.join(re.escape(name) for name in sorted(RELATIVE_PATH_ROOTS)))
+)
+
+
 def get_relative_path(file_path: str, watched_folders: list) -> Optional[str]:
     """Get relative path from known base folders (Dropbox, etc.)"""
-    # Common cloud folder names to look for
-    cloud_folders = ["Dropbox", "OneDrive", "Google Drive", "iCloud Drive"]
-    
     # Check watched folders first
     for watched in watched_folders:
         if file_path.startswith(watched):
@@ -43,13 +68,11 @@ def get_relative_path(file_path: str, watched_folders: list) -> Optional[str]:
             else:
                 return os.path.join(folder_name, rel_path)
     
-    # Check for cloud folders in path
-    path_parts = file_path.split(os.sep)
-    for i, part in enumerate(path_parts):
-        if part in cloud_folders:
-            # Found a cloud folder, get path from there
-            cloud_relative = os.sep.join(path_parts[i:-1])  # Exclude filename
-            return cloud_relative
+    # Check for cloud folders in path, in one regex pass
+    match = _RELATIVE_ROOT_RE.search(file_path)
+    if match:
+        # Found a cloud folder, get path from there, excluding the filename
+        return os.path.dirname(file_path[match.start(1):])
     
     # Check if file is in user's home directory
     home = str(Path.home())
@@ -63,34 +86,409 @@ def get_relative_path(file_path: str, watched_folders: list) -> Optional[str]:
     return None
 
 
-def is_potential_duplicate(file_path: str, file_patterns: list) -> bool:
-    """Check if filename matches duplicate patterns (like file-1.ext, file-2.ext)"""
+# Numbered-copy suffix such as "-1.pdf"; group 1 keeps the extension
+DUPLICATE_SUFFIX_RE = re.compile(r'-\d+(\.[^.]+)$')
+
+
+@lru_cache(maxsize=16)
+def _compile_pattern_tuple(file_patterns: Tuple[str, ...]) -> Optional[Pattern]:
+    if not file_patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in file_patterns))
+
+
+def compile_duplicate_patterns(file_patterns: list) -> Optional[Pattern]:
+    """Combine configured filename patterns into one compiled alternation"""
+    return _compile_pattern_tuple(tuple(file_patterns))
+
+
+def is_potential_duplicate(file_path: str, file_patterns: Union[list, Pattern, None]) -> bool:
+    """Check if filename matches duplicate patterns (like file-1.ext, file-2.ext)
+
+    file_patterns may be the raw pattern list from the config or the result
+    of compile_duplicate_patterns() when called on a hot path.
+    """
     filename = os.path.basename(file_path)
-    
-    # Check against patterns
-    for pattern in file_patterns:
-        match = re.match(pattern, filename)
-        if match:
-            # Check for -1, -2 suffix pattern specifically
-            if re.search(r'-\d+\.[^.]+$', filename):
-                return True
-    
-    return False
+
+    # Most saved files have no hyphen at all; skip the regex for them
+    if '-' not in filename:
+        return False
+
+    # Check for -1, -2 suffix pattern specifically
+    if not DUPLICATE_SUFFIX_RE.search(filename):
+        return False
+
+    if not isinstance(file_patterns, re.Pattern):
+        file_patterns = compile_duplicate_patterns(file_patterns or [])
+    return file_patterns is not None and file_patterns.match(filename) is not None
+
+
+HASH_BUFFER_SIZE = 1024 * 1024  # 1 MiB reads keep syscall count low
+HASH_DROP_CACHE_THRESHOLD = 100 * 1024 * 1024  # Larger files are evicted from page cache after hashing
+
+
+def get_hash_algorithms() -> list:
+    """List hash algorithms selectable in the settings menu"""
+    algorithms = ["md5", "sha1", "sha256", "sha512"]
+    if blake3 is not None:
+        algorithms.append("blake3")
+    if xxhash is not None:
+        algorithms.append("xxh3")
+    return algorithms
+
+
+def new_hasher(algorithm: str) -> Any:
+    """Create a hash object for duplicate comparison (not for security)"""
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("blake3 hashing requires the 'blake3' package")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    if algorithm == "xxh3":
+        if xxhash is None:
+            raise ValueError("xxh3 hashing requires the 'xxhash' package")
+        return xxhash.xxh3_128()
+
+    # Marking the digest as non-security lets OpenSSL pick its fastest
+    # implementation (SHA-NI etc.) even on FIPS-restricted builds
+    if sys.version_info >= (3, 9):
+        return hashlib.new(algorithm, usedforsecurity=False)
+    return hashlib.new(algorithm)
+
+
+def hash_file(file_path: str, algorithm: str) -> str:
+    """Return the hex digest of a file using the named hash algorithm"""
+    with open(file_path, 'rb', buffering=0) as f:
+        # Ask the kernel for aggressive readahead so reads stay queued ahead
+        # of the hasher (Linux/BSD; no-op elsewhere)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        # Plain reads rather than a memory map: files in watched folders can
+        # shrink mid-hash, which only shortens a read but would fault a mapping
+        size = os.fstat(f.fileno()).st_size
+
+        # Python 3.11+ hashes in C with the GIL released
+        if hasattr(hashlib, 'file_digest'):
+            digest = hashlib.file_digest(f, lambda: new_hasher(algorithm)).hexdigest()
+        else:
+            hasher = new_hasher(algorithm)
+            buf = bytearray(HASH_BUFFER_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+            digest = hasher.hexdigest()
+
+        # A huge file read once would otherwise push everything else out
+        # of the page cache; its digest is cached, so drop its pages
+        if size >= HASH_DROP_CACHE_THRESHOLD and hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return digest
+
+
+def _copy_file_contents(src: str, dst: str) -> None:
+    """Copy file data without passing it through Python buffers where possible"""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            return
+        except OSError:
+            pass  # Unsupported by this kernel/filesystem pair
+
+    # Uses sendfile on Linux and fcopyfile on macOS
+    shutil.copyfile(src, dst)
+
+
+def copy_file(src: str, dst: str, metadata: bool = True) -> None:
+    """Copy a file like shutil.copy2 (or shutil.copyfile without metadata), using in-kernel copies"""
+    _copy_file_contents(src, dst)
+    if metadata:
+        shutil.copystat(src, dst)
+
+
+# Numbered names tried before falling back to a random suffix
+UNIQUE_NAME_ATTEMPTS = 10
+
+
+def reserve_unique_path(directory: str, filename: str) -> str:
+    """Atomically create an empty placeholder for a free name in directory
+
+    Tries filename first, then name_1.ext ... name_9.ext, then name_<random>.ext,
+    so a name quarantined many times doesn't cost a failed create per copy.
+    Each attempt is a single O_EXCL create, so concurrent writers can never
+    claim the same name.
+    """
+    name, ext = os.path.splitext(filename)
+    candidate = os.path.join(directory, filename)
+    counter = 1
+    while True:
+        try:
+            os.close(os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            return candidate
+        except FileExistsError:
+            if counter < UNIQUE_NAME_ATTEMPTS:
+                suffix = str(counter)
+            else:
+                suffix = uuid.uuid4().hex[:8]
+            candidate = os.path.join(directory, f"{name}_{suffix}{ext}")
+            counter += 1
+
+
+def move_file(src: str, dst: str) -> None:
+    """Move a file, renaming in place when source and destination share a filesystem
+
+    An existing file at dst (such as a reserved placeholder) is replaced.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    # Different filesystem: copy data and metadata, then remove the source
+    _copy_file_contents(src, dst)
+    shutil.copystat(src, dst)
+    os.unlink(src)
+
+
+def scan_files(top: str, skip_dirs: AbstractSet[str] = frozenset(),
+               skip_names: AbstractSet[str] = frozenset()) -> Iterator[os.DirEntry]:
+    """Recursively yield non-directory entries under top using os.scandir
+
+    Like os.walk, symlinked directories are not followed and unreadable
+    directories are skipped. DirEntry.stat() results are cached per entry.
+    Directories whose name is in skip_names, or whose normcased absolute path
+    is in skip_dirs, are not descended into.
+    """
+    pending = [top]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in skip_names:
+                            continue
+                        if skip_dirs and os.path.normcase(os.path.abspath(entry.path)) in skip_dirs:
+                            continue
+                        pending.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+
+
+def tail_lines(file_path: str, count: int, block_size: int = 8192) -> List[str]:
+    """Return the last count lines of a text file, reading backwards from the end"""
+    with open(file_path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        # One extra newline guarantees the first kept line is complete
+        while pos > 0 and newlines <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+
+    lines = b''.join(reversed(blocks)).splitlines()
+    return [line.decode('utf-8', errors='replace') for line in lines[-count:]]
+
+
+def line_start(file_path: str, offset: int, block_size: int = 8192) -> int:
+    """Return the offset of the line containing offset, reading backwards from it
+
+    An offset just past a newline is already a line start and is returned as is.
+    """
+    with open(file_path, 'rb') as f:
+        pos = offset
+        while pos > 0:
+            step = min(block_size, pos)
+            f.seek(pos - step)
+            cut = f.read(step).rfind(b'\n')
+            if cut != -1:
+                return pos - step + cut + 1
+            pos -= step
+    return 0
+
+
+def iter_line_blocks(file_path: str, block_size: int = HASH_BUFFER_SIZE) -> Iterator[bytes]:
+    """Yield a file's bytes in large blocks that each end on a line boundary
+
+    Reads into one reusable buffer and carries any partial last line over to
+    the next block. The file is opened before this returns.
+    """
+    return _read_line_blocks(open(file_path, 'rb', buffering=0), block_size)
+
+
+def _read_line_blocks(f, block_size: int) -> Iterator[bytes]:
+    """Generator behind iter_line_blocks; closes f when exhausted or discarded"""
+    buf = bytearray(block_size)
+    view = memoryview(buf)
+    tail = b''
+    with f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            block = tail + view[:n]
+            cut = block.rfind(b'\n') + 1
+            if cut:
+                yield block[:cut]
+                tail = block[cut:]
+            else:
+                tail = block
+    if tail:
+        yield tail
+
+
+def find_log_offset(mm: Any, stamp: bytes, after: bool = False) -> int:
+    """Binary search a timestamp-ordered log for the first line at or past stamp
+
+    Lines are compared on their first len(stamp) bytes, so a bare date matches
+    every line from that day. With after=True the first line later than stamp
+    is found instead. Returns a line-start offset, or len(mm) if none qualify.
+    """
+    width = len(stamp)
+    lo, hi = 0, len(mm)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = mm.rfind(b'\n', 0, mid) + 1
+        prefix = mm[start:start + width]
+        if prefix < stamp or (after and prefix == stamp):
+            end = mm.find(b'\n', mid)
+            lo = len(mm) if end == -1 else end + 1
+        else:
+            hi = start
+    return lo
+
+
+def grep_lines(file_path: str, pattern: Pattern, since: Optional[bytes] = None,
+               until: Optional[bytes] = None, start: int = 0,
+               end: Optional[int] = None) -> Iterator[str]:
+    """Yield decoded lines of a file that contain a match for a bytes pattern
+
+    The file is memory-mapped and scanned by the regex engine directly, so
+    only matching lines are ever decoded. since/until limit the scan to a
+    timestamp range located with find_log_offset; start/end limit it to lines
+    beginning in that byte range, so an appended log can be scanned in pieces.
+    The file is opened before this returns, so a missing file raises
+    FileNotFoundError immediately.
+    """
+    return _grep_open_file(open(file_path, 'rb'), pattern, since, until, start, end)
+
+
+def _grep_open_file(f, pattern: Pattern, since: Optional[bytes], until: Optional[bytes],
+                    start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """Generator behind grep_lines; closes f when exhausted or discarded"""
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = find_log_offset(mm, since) if since else 0
+            endpos = find_log_offset(mm, until, after=True) if until else len(mm)
+            if start > pos:
+                # A line already under way at start belongs to the earlier range
+                pos = mm.find(b'\n', start - 1) + 1 or len(mm)
+            if end is not None and end < endpos:
+                # ...and one under way at end is scanned in full here
+                endpos = (mm.find(b'\n', end - 1) + 1 or len(mm)) if end > 0 else 0
+            while pos < endpos:
+                match = pattern.search(mm, pos, endpos)
+                if not match:
+                    return
+                line_start = mm.rfind(b'\n', 0, match.start()) + 1
+                line_end = mm.find(b'\n', match.end())
+                if line_end == -1:
+                    line_end = len(mm)
+                yield mm[line_start:line_end].decode('utf-8', errors='replace')
+                pos = line_end + 1
+
+
+# Filesystem types that get a polling observer instead of native events
+NETWORK_FS_TYPES = {
+    "nfs", "nfs4", "cifs", "smbfs", "smb3", "9p", "afs", "ncpfs",
+    "fuse.sshfs", "fuse.rclone", "davfs", "fuse.davfs2",
+}
+
+
+def minimal_watch_roots(folders: list) -> list:
+    """Drop folders nested inside another watched folder (recursive watches cover them)"""
+    roots = []
+    for folder in sorted(set(os.path.abspath(f) for f in folders)):
+        nested = False
+        for root in roots:
+            try:
+                nested = os.path.commonpath([folder, root]) == root
+            except ValueError:  # Different drives on Windows
+                nested = False
+            if nested:
+                break
+        if not nested:
+            roots.append(folder)
+    return roots
+
+
+def is_network_path(path: str) -> bool:
+    """Check whether path lives on a network filesystem (Linux only, else False)"""
+    try:
+        with open('/proc/mounts', 'r') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+
+    path = os.path.realpath(path)
+    best_mount, best_type = "", ""
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        if len(mount_point) > len(best_mount) and \
+                (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')):
+            best_mount, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+
+# Size units, each 1024 times the previous
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_size(size_bytes: int) -> str:
     """Format bytes into human-readable size"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit spans 10 bits, so the bit length picks it directly
+    unit = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.2f} {SIZE_UNITS[unit]}"
+
+
+# Folder names that mark a cloud sync location, case-normalized for the platform
+CLOUD_FOLDER_INDICATORS = tuple(
+    os.path.normcase(name) for name in ("Dropbox", "OneDrive", "iCloud", "Google Drive")
+)
+_CLOUD_FOLDER_RE = re.compile('|'.join(re.escape(name) for name in CLOUD_FOLDER_INDICATORS))
 
 
 def is_cloud_folder(path: str) -> bool:
     """Check if path is inside a cloud sync folder"""
-    cloud_indicators = ["Dropbox", "OneDrive", "iCloud", "Google Drive"]
-    return any(indicator in path for indicator in cloud_indicators)
+    # normcase first so differently-cased Windows paths share one cache entry
+    return _is_cloud_folder(os.path.normcase(path))
+
+
+@lru_cache(maxsize=256)
+def _is_cloud_folder(path: str) -> bool:
+    """Cached indicator check on an already normcased path"""
+    return _CLOUD_FOLDER_RE.search(path) is not None
+
+
+# Number plus unit, e.g. "5m", "1.5 h", "2months"
+TIME_WINDOW_RE = re.compile(r'^(\d+\.?\d*)\s*([a-z]+)$')
 
 
 def parse_time_window(time_str: str) -> Optional[int]:
@@ -108,7 +506,7 @@ def parse_time_window(time_str: str) -> Optional[int]:
     Returns seconds as integer, or None if invalid format
     """
     time_str = time_str.strip().lower()
-    match = re.match(r'^(\d+\.?\d*)\s*([a-z]+)$', time_str)
+    match = TIME_WINDOW_RE.match(time_str)
     
     if not match:
         return None
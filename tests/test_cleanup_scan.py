@@ -0,0 +1,69 @@
+"""
+Tests for the existing-duplicates cleanup scan
+"""
+import os
+from unittest import mock
+
+import pytest
+
+from duplicate_preventer import duplicate_monitor
+from duplicate_preventer.config import Config
+
+
+def _run_cleanup_scan(tmp_path, use_hash):
+    """Run the cleanup scan over tmp_path/w with moves enabled, answering its prompts"""
+    config = Config(str(tmp_path / "cfg" / "config.json"))
+    config.config["quarantine_path"] = str(tmp_path / "quarantine")
+    config.config["log_file"] = str(tmp_path / "monitor.log")
+    config.config["watched_folders"] = [str(tmp_path / "w")]
+
+    if use_hash:
+        # time window, hash, dry run, proceed
+        answers = iter([False, True, False, True])
+    else:
+        # time window, hash, byte compare, dry run, proceed
+        answers = iter([False, False, False, False, True])
+
+    monitor = duplicate_monitor.DuplicateMonitor(config)
+    with mock.patch.object(duplicate_monitor.Confirm, "ask", side_effect=lambda *a, **k: next(answers)), \
+            mock.patch.object(duplicate_monitor.IntPrompt, "ask", return_value=4), \
+            mock.patch.object(duplicate_monitor.DuplicateMonitor, "_pause"):
+        monitor.clean_existing_duplicates()
+
+
+@pytest.mark.parametrize("use_hash", [True, False])
+def test_numbered_copies_of_each_other_keep_one(tmp_path, use_hash):
+    """Two numbered copies matching only each other must not both be quarantined"""
+    watched = tmp_path / "w"
+    watched.mkdir()
+    (watched / "file.pdf").write_bytes(b"A" * 10)
+    (watched / "file-1.pdf").write_bytes(b"B" * 20)
+    (watched / "file-2.pdf").write_bytes(b"B" * 20)
+
+    _run_cleanup_scan(tmp_path, use_hash)
+
+    remaining = sorted(os.listdir(watched))
+    assert "file.pdf" in remaining
+    assert len([name for name in remaining if name.startswith("file-")]) == 1
+
+
+def test_unreadable_file_does_not_abort_the_scan(tmp_path):
+    """An error checking one file is logged and the rest of the scan carries on"""
+    watched = tmp_path / "w"
+    watched.mkdir()
+    for stem in ("a", "b"):
+        (watched / f"{stem}.pdf").write_bytes(b"same")
+        (watched / f"{stem}-1.pdf").write_bytes(b"same")
+
+    find_original = duplicate_monitor.DuplicateHandler._find_original
+
+    def failing_find_original(handler, file_path, exclude=None):
+        if os.path.basename(file_path) == "a-1.pdf":
+            raise PermissionError(13, "Permission denied", file_path)
+        return find_original(handler, file_path, exclude)
+
+    with mock.patch.object(duplicate_monitor.DuplicateHandler, "_find_original", failing_find_original):
+        _run_cleanup_scan(tmp_path, use_hash=True)
+
+    assert sorted(os.listdir(watched)) == ["a-1.pdf", "a.pdf", "b.pdf"]
+    assert "FAILED - Error checking" in (tmp_path / "monitor.log").read_text()
@@ -0,0 +1,49 @@
+"""
+Tests for matching a numbered copy to its original
+"""
+import os
+
+import pytest
+
+from duplicate_preventer.config import Config
+from duplicate_preventer.duplicate_handler import DuplicateHandler
+
+
+# Creating symlinks needs extra privileges on Windows
+requires_symlinks = pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt",
+                                       reason="symlinks unavailable")
+
+
+@pytest.fixture
+def handler(tmp_path):
+    config = Config(str(tmp_path / "cfg" / "config.json"))
+    config.config["quarantine_path"] = str(tmp_path / "quarantine")
+    config.config["log_file"] = str(tmp_path / "monitor.log")
+    config.config["watched_folders"] = [str(tmp_path / "w")]
+    handler = DuplicateHandler(config)
+    yield handler
+    handler.close()
+
+
+@requires_symlinks
+def test_symlinked_original_is_matched(tmp_path, handler):
+    """A symlink to a regular file is a valid original, as os.path.isfile allowed"""
+    watched = tmp_path / "w"
+    watched.mkdir()
+    target = tmp_path / "elsewhere.pdf"
+    target.write_bytes(b"same")
+    os.symlink(str(target), str(watched / "a.pdf"))
+    (watched / "a-1.pdf").write_bytes(b"same")
+
+    assert handler._find_original(str(watched / "a-1.pdf")) == str(watched / "a.pdf")
+
+
+@requires_symlinks
+def test_dangling_symlink_is_not_an_original(tmp_path, handler):
+    """A symlink whose target is gone is skipped rather than failing the check"""
+    watched = tmp_path / "w"
+    watched.mkdir()
+    os.symlink(str(tmp_path / "missing.pdf"), str(watched / "a.pdf"))
+    (watched / "a-1.pdf").write_bytes(b"same")
+
+    assert handler._find_original(str(watched / "a-1.pdf")) is None
@@ -0,0 +1,31 @@
+"""
+Tests for the log viewing and clearing menu options
+"""
+from unittest import mock
+
+from duplicate_preventer import duplicate_monitor
+from duplicate_preventer.config import Config
+
+
+def test_error_lines_rescanned_after_log_is_cleared_and_regrows(tmp_path):
+    """Clearing the log must not leave the error view scanning from the old offset"""
+    log_file = tmp_path / "monitor.log"
+    config = Config(str(tmp_path / "cfg" / "config.json"))
+    config.config["log_file"] = str(log_file)
+    monitor = duplicate_monitor.DuplicateMonitor(config)
+
+    log_file.write_text("".join(f"2026-01-01 00:00:00 | ERROR    | old failure {i}\n" for i in range(20)))
+    assert len(monitor._error_log_lines(str(log_file))) == 20
+
+    with mock.patch.object(duplicate_monitor.Confirm, "ask", return_value=True), \
+            mock.patch.object(duplicate_monitor.DuplicateMonitor, "_pause"):
+        monitor._clear_old_logs()
+
+    # Regrow the cleared log past the length it had before
+    with open(log_file, "a") as f:
+        for i in range(40):
+            f.write(f"2026-01-02 00:00:00 | ERROR    | new failure {i}\n")
+
+    lines = monitor._error_log_lines(str(log_file))
+    assert len(lines) == 40
+    assert all("new failure" in line for line in lines)
@@ -0,0 +1,37 @@
+"""
+Tests for the --start command-line option
+"""
+import threading
+from unittest import mock
+
+from duplicate_preventer import duplicate_monitor
+from duplicate_preventer.config import Config
+
+
+def test_start_returns_to_menu_when_another_instance_holds_the_lock(tmp_path):
+    """--start must not wait forever when monitoring could not start"""
+    watched = tmp_path / "w"
+    watched.mkdir()
+    config_file = tmp_path / "cfg" / "config.json"
+    config = Config(str(config_file))
+    config.set("watched_folders", [str(watched)])
+    config.set("quarantine_path", str(tmp_path / "quarantine"))
+    config.set("log_file", str(tmp_path / "monitor.log"))
+
+    # Another instance is already monitoring
+    holder = duplicate_monitor.DuplicateMonitor(config)
+    assert holder._create_monitor_lock()
+
+    show_menu = mock.Mock()
+    try:
+        with mock.patch("sys.argv", ["duplicate-monitor", "--start", "--config", str(config_file)]), \
+                mock.patch.object(duplicate_monitor.DuplicateMonitor, "_pause"), \
+                mock.patch.object(duplicate_monitor.DuplicateMonitor, "show_menu", show_menu):
+            runner = threading.Thread(target=duplicate_monitor.main, daemon=True)
+            runner.start()
+            runner.join(timeout=10)
+    finally:
+        holder._release_monitor_lock()
+
+    assert not runner.is_alive()
+    show_menu.assert_called_once()